@@ -37,6 +37,13 @@ if __name__ == "__main__":
             def default(self, o: object) -> typing.Any:
                 if hasattr(o, '__dict__'):
                     return o.__dict__
+                if hasattr(o, '__slots__'):
+                    return {
+                        name: getattr(o, name)
+                        for cls in reversed(type(o).mro())
+                        for name in getattr(cls, '__slots__', ())
+                        if not name.startswith('_') and hasattr(o, name)
+                    }
                 if hasattr(o, '__str__'):
                     return str(o)
                 else:
@@ -4,6 +4,7 @@ The abstract base class is :py:class:`Cipher`.
 """
 
 import abc
+import sys
 import typing
 
 from cryptography.hazmat.primitives import ciphers
@@ -189,8 +190,8 @@ class AES256_CTRCipher(Cipher):
 
 
 _CIPHER_MAPPING = {
-    'none': NoneCipher,
-    'aes256-ctr': AES256_CTRCipher
+    sys.intern('none'): NoneCipher,
+    sys.intern('aes256-ctr'): AES256_CTRCipher
 }
 
 
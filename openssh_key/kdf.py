@@ -5,6 +5,7 @@ The abstract base class is :py:class:`KDF`.
 
 import abc
 import secrets
+import sys
 import types
 import typing
 
@@ -258,8 +259,8 @@ class BcryptKDF(KDF):
 
 
 _KDF_MAPPING = {
-    'none': NoneKDF,
-    'bcrypt': BcryptKDF
+    sys.intern('none'): NoneKDF,
+    sys.intern('bcrypt'): BcryptKDF
 }
 
 
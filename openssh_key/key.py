@@ -4,6 +4,7 @@
 
 import abc
 import base64
+import sys
 import types
 import typing
 import warnings
@@ -24,6 +25,54 @@ KeyTypeVar = typing.TypeVar(
 )
 
 
+class _PackedBytesCache(typing.NamedTuple):
+    """A byte string packed from a :any:`Key`, and shallow copies of the
+    values from which it was packed.
+    """
+    header: ValuesDict
+    """The values in the encoded header.
+    """
+    params_class: typing.Type[PublicKeyParams]
+    """The class of the parameters object.
+    """
+    params: ValuesDict
+    """The parameter values.
+    """
+    footer: ValuesDict
+    """The values in the encoded footer.
+    """
+    packed_bytes: bytes
+    """The packed byte string.
+    """
+
+    @classmethod
+    def create(
+        cls,
+        key: 'Key[typing.Any]',
+        packed_bytes: bytes
+    ) -> '_PackedBytesCache':
+        """Records a byte string packed from the current values of a key.
+        """
+        return cls(
+            dict(key.header),
+            type(key.params),
+            dict(key.params),
+            dict(key.footer),
+            packed_bytes
+        )
+
+    def is_valid_for(self, key: 'Key[typing.Any]') -> bool:
+        """Returns whether the values of a key are unchanged since the byte
+        string was packed.
+        """
+        return (
+            self.params_class is type(key.params) and
+            self.header == key.header and
+            self.params == key.params and
+            self.footer == key.footer
+        )
+
+
 class Key(typing.Generic[PublicKeyParamsTypeVar], abc.ABC):
     """A container for a :any:`PublicKeyParams`, an encoded header and footer,
     and cleartext key details.
@@ -38,9 +87,19 @@ class Key(typing.Generic[PublicKeyParamsTypeVar], abc.ABC):
         clear
             A :any:`typing.Mapping` with cleartext key details, if any.
     """
+    __slots__ = (
+        'header',
+        'params',
+        'footer',
+        'clear',
+        '__packed_bytes_caches'
+    )
+
+    __packed_bytes_caches: typing.Dict[str, _PackedBytesCache]
+
     __HEADER_FORMAT_INSTRUCTIONS_DICT: typing.ClassVar[
         FormatInstructionsDict
-    ] = {}
+    ] = types.MappingProxyType({})
 
     @staticmethod
     @abc.abstractmethod
@@ -48,9 +107,7 @@ class Key(typing.Generic[PublicKeyParamsTypeVar], abc.ABC):
         """The Pascal-style byte stream format instructions for the encoded
         header.
         """
-        return types.MappingProxyType(
-            Key.__HEADER_FORMAT_INSTRUCTIONS_DICT
-        )
+        return Key.__HEADER_FORMAT_INSTRUCTIONS_DICT
 
     HEADER_FORMAT_INSTRUCTIONS_DICT = utils.readonly_static_property(
         get_header_format_instructions_dict
@@ -61,7 +118,7 @@ class Key(typing.Generic[PublicKeyParamsTypeVar], abc.ABC):
 
     __FOOTER_FORMAT_INSTRUCTIONS_DICT: typing.ClassVar[
         FormatInstructionsDict
-    ] = {}
+    ] = types.MappingProxyType({})
 
     @staticmethod
     @abc.abstractmethod
@@ -69,9 +126,7 @@ class Key(typing.Generic[PublicKeyParamsTypeVar], abc.ABC):
         """The Pascal-style byte stream format instructions for the encoded
         footer.
         """
-        return types.MappingProxyType(
-            Key.__FOOTER_FORMAT_INSTRUCTIONS_DICT
-        )
+        return Key.__FOOTER_FORMAT_INSTRUCTIONS_DICT
 
     FOOTER_FORMAT_INSTRUCTIONS_DICT = utils.readonly_static_property(
         get_footer_format_instructions_dict
@@ -135,7 +190,12 @@ class Key(typing.Generic[PublicKeyParamsTypeVar], abc.ABC):
             self.HEADER_FORMAT_INSTRUCTIONS_DICT
         )
 
-        self.params = self.create_key_params(header['key_type'], params)
+        key_type = self.header['key_type']
+        if isinstance(key_type, str):
+            # Interned so that looking up the key type name hits the fast
+            # path for the interned keys of the key parameters factory.
+            key_type = self.header['key_type'] = sys.intern(key_type)
+        self.params = self.create_key_params(key_type, params)
 
         self.footer = dict(footer)
 
@@ -146,6 +206,8 @@ class Key(typing.Generic[PublicKeyParamsTypeVar], abc.ABC):
 
         self.clear = dict(clear) if clear is not None else {}
 
+        self.__packed_bytes_caches = {}
+
     @classmethod
     def from_byte_stream(
         cls: typing.Type[KeyTypeVar],
@@ -214,6 +276,28 @@ class Key(typing.Generic[PublicKeyParamsTypeVar], abc.ABC):
 
         return key
 
+    @classmethod
+    def peek_header(
+        cls,
+        byte_string: bytes
+    ) -> ValuesDict:
+        """Parses only the encoded header from the start of a given byte
+        string, without parsing or checking the parameter values and encoded
+        footer that follow it.
+
+        Args:
+            byte_string
+                The byte string from which to parse.
+
+        Returns:
+            The values in the encoded header.
+        """
+        return PascalStyleByteStream(
+            byte_string
+        ).read_from_format_instructions_dict(
+            cls.HEADER_FORMAT_INSTRUCTIONS_DICT
+        )
+
     @classmethod
     def from_string(
         cls: typing.Type[KeyTypeVar],
@@ -253,14 +337,32 @@ class Key(typing.Generic[PublicKeyParamsTypeVar], abc.ABC):
             )
         return public_key
 
+    def _get_packed_bytes(
+        self,
+        name: str,
+        pack: typing.Callable[[], bytes]
+    ) -> bytes:
+        packed_bytes_cache = self.__packed_bytes_caches.get(name)
+        if packed_bytes_cache is None \
+                or not packed_bytes_cache.is_valid_for(self):
+            packed_bytes_cache = _PackedBytesCache.create(self, pack())
+            self.__packed_bytes_caches[name] = packed_bytes_cache
+        return packed_bytes_cache.packed_bytes
+
     def pack_public_bytes(self) -> bytes:
         """Packs the public parameter values, encoded header, and encoded
         footer into a byte string.
 
+        The byte string is cached until the encoded header, parameter values,
+        or encoded footer change.
+
         Returns:
             A byte string containing the public parameter values, encoded
             header, and encoded footer.
         """
+        return self._get_packed_bytes('public', self._pack_public_bytes)
+
+    def _pack_public_bytes(self) -> bytes:
         key_byte_stream = PascalStyleByteStream()
 
         key_byte_stream.write_from_format_instructions_dict(
@@ -327,6 +429,8 @@ class Key(typing.Generic[PublicKeyParamsTypeVar], abc.ABC):
         return text
 
     def __eq__(self, other: typing.Any) -> bool:
+        if self is other:
+            return True
         return (
             type(self) is type(other) and
             self.header == other.header and
@@ -341,33 +445,31 @@ class PublicKey(Key[PublicKeyParams]):
     and cleartext key details.
     """
 
+    __slots__ = ()
+
     __HEADER_FORMAT_INSTRUCTIONS_DICT: typing.ClassVar[
         FormatInstructionsDict
-    ] = {
+    ] = types.MappingProxyType({
         'key_type': PascalStyleFormatInstruction.STRING
-    }
+    })
 
     @staticmethod
     def get_header_format_instructions_dict() -> FormatInstructionsDict:
         """The Pascal-style byte stream format instructions for the encoded
         header.
         """
-        return types.MappingProxyType(
-            PublicKey.__HEADER_FORMAT_INSTRUCTIONS_DICT
-        )
+        return PublicKey.__HEADER_FORMAT_INSTRUCTIONS_DICT
 
     __FOOTER_FORMAT_INSTRUCTIONS_DICT: typing.ClassVar[
         FormatInstructionsDict
-    ] = {}
+    ] = types.MappingProxyType({})
 
     @staticmethod
     def get_footer_format_instructions_dict() -> FormatInstructionsDict:
         """The Pascal-style byte stream format instructions for the encoded
         footer.
         """
-        return types.MappingProxyType(
-            PublicKey.__FOOTER_FORMAT_INSTRUCTIONS_DICT
-        )
+        return PublicKey.__FOOTER_FORMAT_INSTRUCTIONS_DICT
 
 
     @staticmethod
@@ -383,29 +485,27 @@ class PrivateKey(Key[PrivateKeyParams]):
     footer.
     """
 
+    __slots__ = ()
+
     __HEADER_FORMAT_INSTRUCTIONS_DICT: typing.ClassVar[
         FormatInstructionsDict
-    ] = {
+    ] = types.MappingProxyType({
         'key_type': PascalStyleFormatInstruction.STRING
-    }
+    })
 
     @staticmethod
     def get_header_format_instructions_dict() -> FormatInstructionsDict:
-        return types.MappingProxyType(
-            PrivateKey.__HEADER_FORMAT_INSTRUCTIONS_DICT
-        )
+        return PrivateKey.__HEADER_FORMAT_INSTRUCTIONS_DICT
 
     __FOOTER_FORMAT_INSTRUCTIONS_DICT: typing.ClassVar[
         FormatInstructionsDict
-    ] = {
+    ] = types.MappingProxyType({
         'comment': PascalStyleFormatInstruction.STRING
-    }
+    })
     
     @staticmethod
     def get_footer_format_instructions_dict() -> FormatInstructionsDict:
-        return types.MappingProxyType(
-            PrivateKey.__FOOTER_FORMAT_INSTRUCTIONS_DICT
-        )
+        return PrivateKey.__FOOTER_FORMAT_INSTRUCTIONS_DICT
 
     @staticmethod
     def create_key_params_dict(
@@ -442,10 +542,16 @@ class PrivateKey(Key[PrivateKeyParams]):
         """Packs the private parameter values, encoded header, and encoded
         footer into a byte string.
 
+        The byte string is cached until the encoded header, parameter values,
+        or encoded footer change.
+
         Returns:
             A byte string containing the private parameter values, encoded
             header, and encoded footer.
         """
+        return self._get_packed_bytes('private', self._pack_private_bytes)
+
+    def _pack_private_bytes(self) -> bytes:
         key_byte_stream = PascalStyleByteStream()
 
         key_byte_stream.write_from_format_instructions_dict(
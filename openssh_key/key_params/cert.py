@@ -6,6 +6,7 @@ Classes representing OpenSSH host and user certificates.
 import abc
 import datetime
 import enum
+import functools
 import types
 import typing
 import warnings
@@ -218,6 +219,8 @@ class CertPublicKeyParams(PublicKeyParams, abc.ABC):
             ``params`` or does not have the correct type.
     """
 
+    __slots__ = ()
+
     @staticmethod
     @abc.abstractmethod
     def get_cert_base_public_key_class() -> typing.Type[PublicKeyParams]:
@@ -226,11 +229,15 @@ class CertPublicKeyParams(PublicKeyParams, abc.ABC):
         """
         return PublicKeyParams
 
-    __FORMAT_INSTRUCTIONS_DICT_SIGNED_BYTES_PREFIX: typing.ClassVar[FormatInstructionsDict] = {
+    __FORMAT_INSTRUCTIONS_DICT_SIGNED_BYTES_PREFIX: typing.ClassVar[
+        FormatInstructionsDict
+    ] = types.MappingProxyType({
         'nonce': PascalStyleFormatInstruction.BYTES,
-    }
+    })
 
-    __FORMAT_INSTRUCTIONS_DICT_SIGNED_BYTES_SUFFIX: typing.ClassVar[FormatInstructionsDict] = {
+    __FORMAT_INSTRUCTIONS_DICT_SIGNED_BYTES_SUFFIX: typing.ClassVar[
+        FormatInstructionsDict
+    ] = types.MappingProxyType({
         'serial': '>Q',
         'type': '>I',
         'key_id': PascalStyleFormatInstruction.STRING,
@@ -241,19 +248,31 @@ class CertPublicKeyParams(PublicKeyParams, abc.ABC):
         'extensions': PascalStyleFormatInstruction.BYTES,
         'reserved': PascalStyleFormatInstruction.BYTES,
         'signature_key': PascalStyleFormatInstruction.BYTES,
-    }
+    })
 
-    __FORMAT_INSTRUCTIONS_DICT_SIGNATURE: typing.ClassVar[FormatInstructionsDict] = {
+    __FORMAT_INSTRUCTIONS_DICT_SIGNATURE: typing.ClassVar[
+        FormatInstructionsDict
+    ] = types.MappingProxyType({
         'signature': PascalStyleFormatInstruction.BYTES,
-    }
+    })
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_format_instructions_dict(cls) -> FormatInstructionsDict:
         return types.MappingProxyType({
-            **CertPublicKeyParams.__FORMAT_INSTRUCTIONS_DICT_SIGNED_BYTES_PREFIX,
+            **cls._get_signed_bytes_format_instructions_dict(),
+            **cls.__FORMAT_INSTRUCTIONS_DICT_SIGNATURE
+        })
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_signed_bytes_format_instructions_dict(
+        cls
+    ) -> FormatInstructionsDict:
+        return types.MappingProxyType({
+            **cls.__FORMAT_INSTRUCTIONS_DICT_SIGNED_BYTES_PREFIX,
             **cls.get_cert_base_public_key_class().get_format_instructions_dict(),
-            **CertPublicKeyParams.__FORMAT_INSTRUCTIONS_DICT_SIGNED_BYTES_SUFFIX,
-            **CertPublicKeyParams.__FORMAT_INSTRUCTIONS_DICT_SIGNATURE
+            **cls.__FORMAT_INSTRUCTIONS_DICT_SIGNED_BYTES_SUFFIX,
         })
 
     def get_type(self) -> CertPrincipalType:
@@ -522,11 +541,7 @@ class CertPublicKeyParams(PublicKeyParams, abc.ABC):
         """
         signed_byte_stream = PascalStyleByteStream()
         signed_byte_stream.write_from_format_instructions_dict(
-            {
-                **CertPublicKeyParams.__FORMAT_INSTRUCTIONS_DICT_SIGNED_BYTES_PREFIX,
-                **self.get_cert_base_public_key_class().get_format_instructions_dict(),
-                **CertPublicKeyParams.__FORMAT_INSTRUCTIONS_DICT_SIGNED_BYTES_SUFFIX,
-            },
+            self._get_signed_bytes_format_instructions_dict(),
             self
         )
         return signed_byte_stream.getvalue()
@@ -607,6 +622,8 @@ class Cert_RSA_PublicKeyParams(CertPublicKeyParams, RSAPublicKeyParams):
     The parameters comprising a certificate for an RSA public key.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def get_cert_base_public_key_class() -> typing.Type[PublicKeyParams]:
         return RSAPublicKeyParams
@@ -617,6 +634,8 @@ class Cert_Ed25519_PublicKeyParams(CertPublicKeyParams, Ed25519PublicKeyParams):
     The parameters comprising a certificate for an Ed25519 public key.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def get_cert_base_public_key_class() -> typing.Type[PublicKeyParams]:
         return Ed25519PublicKeyParams
@@ -627,6 +646,8 @@ class Cert_DSS_PublicKeyParams(CertPublicKeyParams, DSSPublicKeyParams):
     The parameters comprising a certificate for a DSS public key.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def get_cert_base_public_key_class() -> typing.Type[PublicKeyParams]:
         return DSSPublicKeyParams
@@ -638,6 +659,8 @@ class Cert_ECDSA_NISTP256_PublicKeyParams(CertPublicKeyParams, ECDSA_NISTP256_Pu
     ``nistp256`` curve.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def get_cert_base_public_key_class() -> typing.Type[PublicKeyParams]:
         return ECDSA_NISTP256_PublicKeyParams
@@ -649,6 +672,8 @@ class Cert_ECDSA_NISTP384_PublicKeyParams(CertPublicKeyParams, ECDSA_NISTP384_Pu
     ``nistp384`` curve.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def get_cert_base_public_key_class() -> typing.Type[PublicKeyParams]:
         return ECDSA_NISTP384_PublicKeyParams
@@ -660,6 +685,8 @@ class Cert_ECDSA_NISTP521_PublicKeyParams(CertPublicKeyParams, ECDSA_NISTP521_Pu
     ``nistp521`` curve.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def get_cert_base_public_key_class() -> typing.Type[PublicKeyParams]:
         return ECDSA_NISTP521_PublicKeyParams
@@ -671,6 +698,8 @@ class Cert_SecurityKey_Ed25519_PublicKeyParams(CertPublicKeyParams, SecurityKey_
     corresponds to a private key stored on a security key.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def get_cert_base_public_key_class() -> typing.Type[PublicKeyParams]:
         return SecurityKey_Ed25519_PublicKeyParams
@@ -682,6 +711,8 @@ class Cert_SecurityKey_ECDSA_NISTP256_PublicKeyParams(CertPublicKeyParams, Secur
     corresponds to a private key stored on a security key.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def get_cert_base_public_key_class() -> typing.Type[PublicKeyParams]:
         return SecurityKey_ECDSA_NISTP256_PublicKeyParams
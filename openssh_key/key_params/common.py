@@ -3,7 +3,7 @@ cryptosystems.
 """
 
 import abc
-import collections
+import functools
 import types
 import typing
 
@@ -39,13 +39,7 @@ class ConversionFunctions(typing.NamedTuple):
     """
 
 
-# https://github.com/python/mypy/issues/5264
-if typing.TYPE_CHECKING:  # pragma: no cover
-    BaseDict = collections.UserDict[  # pylint: disable=unsubscriptable-object
-        str, typing.Any
-    ]
-else:
-    BaseDict = collections.UserDict
+BaseDict = typing.Dict[str, typing.Any]
 
 
 class PublicKeyParams(BaseDict, abc.ABC):
@@ -66,10 +60,112 @@ class PublicKeyParams(BaseDict, abc.ABC):
             that matches the format instructions for this key type.
     """
 
+    __slots__ = ('__converted_objects',)
+
+    def __new__(
+        cls: typing.Type[PublicKeyParamsTypeVar],
+        *args: typing.Any,
+        **kwargs: typing.Any
+    ) -> PublicKeyParamsTypeVar:
+        # Unlike object.__new__, dict.__new__ does not refuse to instantiate
+        # abstract classes
+        if utils.is_abstract(cls):
+            raise TypeError(
+                f"Can't instantiate abstract class {cls.__name__}"
+            )
+        key_params = super().__new__(cls, *args, **kwargs)
+        key_params.__converted_objects = {}  # pylint: disable=protected-access
+        return key_params
+
+    __converted_objects: typing.Dict[
+        type,
+        typing.Tuple[ValuesDict, typing.Any]
+    ]
+
     def __init__(self, params: ValuesDict):
         super().__init__(params)
         self.check_params_are_valid()
 
+    @classmethod
+    def _from_trusted_params(
+        cls: typing.Type[PublicKeyParamsTypeVar],
+        params: ValuesDict
+    ) -> PublicKeyParamsTypeVar:
+        """Constructs and initializes a parameters object without checking
+        the given values, which must already be known to be valid for this
+        key type (e.g. because they were just generated).
+        """
+        key_params = cls.__new__(cls)
+        key_params.update(params)
+        return key_params
+
+    def copy(self: PublicKeyParamsTypeVar) -> PublicKeyParamsTypeVar:
+        """Returns a shallow copy of this parameters object, of the same
+        class.
+        """
+        return type(self)._from_trusted_params(self)
+
+    def __reduce__(self) -> typing.Tuple[typing.Any, ...]:
+        # Pickles and copies only the parameter values, and not the cache of
+        # converted objects, which may not be picklable
+        return (type(self)._from_trusted_params, (dict(self),))
+
+    def __or__(  # type: ignore[override]
+        self: PublicKeyParamsTypeVar,
+        other: typing.Any
+    ) -> PublicKeyParamsTypeVar:
+        if not isinstance(other, dict):
+            return NotImplemented
+        return type(self)({**self, **other})
+
+    def __ror__(  # type: ignore[override]
+        self: PublicKeyParamsTypeVar,
+        other: typing.Any
+    ) -> PublicKeyParamsTypeVar:
+        if not isinstance(other, dict):
+            return NotImplemented
+        return type(self)({**other, **self})
+
+    __CONVERSION_CLASSES: typing.ClassVar[typing.Dict[
+        typing.Type['PublicKeyParams'],
+        typing.Mapping[
+            typing.Type['PublicKeyParams'],
+            typing.Tuple[
+                typing.Type['PublicKeyParams'],
+                typing.Tuple[str, ...]
+            ]
+        ]
+    ]] = {}
+
+    def __init_subclass__(cls, **kwargs: typing.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        PublicKeyParams.__CONVERSION_CLASSES.clear()
+        # Shadows the static property of the same name with a plain class
+        # attribute, as the format instructions of a class do not change
+        cls.FORMAT_INSTRUCTIONS_DICT = \
+            cls.get_format_instructions_dict()  # type: ignore[assignment]
+
+    @classmethod
+    def iter_conversion_classes(
+        cls
+    ) -> typing.Iterator[typing.Tuple[
+        typing.Type['PublicKeyParams'],
+        typing.Type['PublicKeyParams']
+    ]]:
+        """Yields the classes whose :any:`conversion_functions` are searched
+        by :any:`convert_from`, in order: this class, then its subclasses,
+        traversing pre-order.
+
+        Returns:
+            An iterator of pairs of a class whose :any:`conversion_functions`
+            are searched, and the class of the parameters object that
+            :any:`convert_from` constructs if the search succeeds.
+        """
+        yield cls, cls
+        for subcls in cls.__subclasses__():
+            for conversion_class, _ in subcls.iter_conversion_classes():
+                yield conversion_class, cls
+
     @classmethod
     def convert_from(
         cls,
@@ -84,6 +180,9 @@ class PublicKeyParams(BaseDict, abc.ABC):
         corresponding :any:`object_to_mapping` function. Otherwise, it searches
         its subclasses' :any:`conversion_functions`, traversing pre-order.
 
+        The order in which classes are searched is computed once per class,
+        and recomputed if a new subclass of :any:`PublicKeyParams` is defined.
+
         Args:
             key_object
                 An object containing key parameter values.
@@ -93,24 +192,29 @@ class PublicKeyParams(BaseDict, abc.ABC):
                 or it does not contain the attributes necessary to construct
                 a parameters object of this class.
         """
-        params_dict: typing.Optional[ValuesDict] = None
-        for k, v in cls.conversion_functions().items():
-            if isinstance(key_object, k):
-                params_dict = v.object_to_mapping(key_object)
-                break
-        if params_dict is None:
-            for subcls in cls.__subclasses__():
-                try:
-                    params_dict = dict(subcls.convert_from(key_object))
-                except NotImplementedError:
-                    pass
-                if params_dict is not None:
+        conversion_classes = PublicKeyParams.__CONVERSION_CLASSES.get(cls)
+        if conversion_classes is None:
+            conversion_classes = {}
+            for conversion_class, params_class in \
+                    cls.iter_conversion_classes():
+                if conversion_class not in conversion_classes:
+                    conversion_classes[conversion_class] = (
+                        params_class,
+                        tuple(params_class.FORMAT_INSTRUCTIONS_DICT)
+                    )
+            PublicKeyParams.__CONVERSION_CLASSES[cls] = conversion_classes
+        for conversion_class, (params_class, params_keys) in \
+                conversion_classes.items():
+            params_dict: typing.Optional[ValuesDict] = None
+            for k, v in conversion_class.conversion_functions().items():
+                if isinstance(key_object, k):
+                    params_dict = v.object_to_mapping(key_object)
                     break
-        if params_dict is not None:
-            return cls({
-                k: params_dict[k]
-                for k in cls.FORMAT_INSTRUCTIONS_DICT
-            })
+            if params_dict is not None:
+                return params_class({
+                    k: params_dict[k]
+                    for k in params_keys
+                })
         raise NotImplementedError()
 
     @classmethod
@@ -129,7 +233,9 @@ class PublicKeyParams(BaseDict, abc.ABC):
         """
         return {}
 
-    __FORMAT_INSTRUCTIONS_DICT: typing.ClassVar[FormatInstructionsDict] = {}
+    __FORMAT_INSTRUCTIONS_DICT: typing.ClassVar[
+        FormatInstructionsDict
+    ] = types.MappingProxyType({})
 
     @classmethod
     @abc.abstractmethod
@@ -137,9 +243,7 @@ class PublicKeyParams(BaseDict, abc.ABC):
         """The Pascal-style byte stream format instructions for the parameters
         of a key of this type.
         """
-        return types.MappingProxyType(
-            PublicKeyParams.__FORMAT_INSTRUCTIONS_DICT
-        )
+        return PublicKeyParams.__FORMAT_INSTRUCTIONS_DICT
 
     FORMAT_INSTRUCTIONS_DICT = utils.readonly_static_property(
         get_format_instructions_dict
@@ -157,7 +261,7 @@ class PublicKeyParams(BaseDict, abc.ABC):
                 that matches the format instructions for this key type.
         """
         PascalStyleByteStream.check_dict_matches_format_instructions_dict(
-            self.data,
+            self,
             self.FORMAT_INSTRUCTIONS_DICT
         )
 
@@ -173,7 +277,12 @@ class PublicKeyParams(BaseDict, abc.ABC):
         parameters object to the corresponding :any:`mapping_to_object`.
         Otherwise, it searches its superclasses' :any:`conversion_functions`
         in the same way, in method resolution order, up to and including
-        :any:`PublicKeyParams`.
+        :any:`PublicKeyParams`. The result of the search is cached for each
+        class and ``destination_class``.
+
+        The converted object is cached, and returned again by later calls
+        with the same ``destination_class`` until the values of this
+        parameters object change.
 
         Args:
             destination_class
@@ -188,15 +297,32 @@ class PublicKeyParams(BaseDict, abc.ABC):
         """
         if not isinstance(destination_class, type):
             raise ValueError('destination_class must be a class')
-        for supercls in self.__class__.__mro__:
+        converted_object = self.__converted_objects.get(destination_class)
+        if converted_object is not None and converted_object[0] == self:
+            return converted_object[1]
+        conversion_functions = self._find_conversion_functions_to(
+            typing.cast(type, destination_class)
+        )
+        if conversion_functions is None:
+            raise NotImplementedError()
+        key_object = conversion_functions.mapping_to_object(self)
+        self.__converted_objects[destination_class] = (dict(self), key_object)
+        return key_object
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _find_conversion_functions_to(
+        cls,
+        destination_class: type
+    ) -> typing.Optional[ConversionFunctions]:
+        for supercls in cls.__mro__:
             if not issubclass(supercls, PublicKeyParams):
                 break
-            for candidate_class in supercls.conversion_functions():
+            for candidate_class, conversion_functions in \
+                    supercls.conversion_functions().items():
                 if issubclass(candidate_class, destination_class):
-                    return supercls.conversion_functions()[
-                        candidate_class
-                    ].mapping_to_object(self)
-        raise NotImplementedError()
+                    return conversion_functions
+        return None
 
 
 PrivateKeyParamsTypeVar = typing.TypeVar(
@@ -215,6 +341,8 @@ class PrivateKeyParams(PublicKeyParams):
     `ssh-agent protocol <https://tools.ietf.org/html/draft-miller-ssh-agent-03#section-4.2>`_.
     """
 
+    __slots__ = ()
+
     @classmethod
     @abc.abstractmethod
     def generate_private_params(
@@ -5,6 +5,7 @@ Classes representing DSS keys.
 import types
 import typing
 
+from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import dsa
 from openssh_key import utils
 from openssh_key.pascal_style_byte_stream import (FormatInstructionsDict,
@@ -14,6 +15,56 @@ from openssh_key.pascal_style_byte_stream import (FormatInstructionsDict,
 from .common import ConversionFunctions, PrivateKeyParams, PublicKeyParams
 
 
+_DSS_PUBLIC_FIELDS: typing.Tuple[
+    typing.Tuple[str, PascalStyleFormatInstruction], ...
+] = (
+    ('p', PascalStyleFormatInstruction.MPINT),
+    ('q', PascalStyleFormatInstruction.MPINT),
+    ('g', PascalStyleFormatInstruction.MPINT),
+    ('y', PascalStyleFormatInstruction.MPINT),
+)
+_DSS_PRIVATE_FIELDS = _DSS_PUBLIC_FIELDS + (
+    ('x', PascalStyleFormatInstruction.MPINT),
+)
+
+
+def _dsa_public_key_convert_from_cryptography(
+    key_object: dsa.DSAPublicKey
+) -> ValuesDict:
+    public_numbers = key_object.public_numbers()
+    parameter_numbers = public_numbers.parameter_numbers
+    return {
+        'p': parameter_numbers.p,
+        'q': parameter_numbers.q,
+        'g': parameter_numbers.g,
+        'y': public_numbers.y,
+    }
+
+
+def _dsa_public_key_convert_to_cryptography(
+    key_params: ValuesDict
+) -> dsa.DSAPublicKey:
+    return dsa.DSAPublicNumbers(
+        key_params['y'],
+        dsa.DSAParameterNumbers(
+            key_params['p'],
+            key_params['q'],
+            key_params['g']
+        )
+    ).public_key()
+
+
+_DSA_PUBLIC_KEY_CONVERSION_FUNCTIONS: typing.Mapping[
+    typing.Type[typing.Any],
+    ConversionFunctions
+] = types.MappingProxyType({
+    dsa.DSAPublicKey: ConversionFunctions(
+        _dsa_public_key_convert_from_cryptography,
+        _dsa_public_key_convert_to_cryptography
+    )
+})
+
+
 class DSSPublicKeyParams(PublicKeyParams):
     """The parameters comprising a key in the Digital Signature Standard
     cryptosystem (FIPS 186).
@@ -40,18 +91,16 @@ class DSSPublicKeyParams(PublicKeyParams):
         UserWarning: A parameter value from the above list is missing from
             ``params`` or does not have the correct type.
     """
-    __FORMAT_INSTRUCTIONS_DICT: typing.ClassVar[FormatInstructionsDict] = {
-        'p': PascalStyleFormatInstruction.MPINT,
-        'q': PascalStyleFormatInstruction.MPINT,
-        'g': PascalStyleFormatInstruction.MPINT,
-        'y': PascalStyleFormatInstruction.MPINT,
-    }
+
+    __slots__ = ()
+
+    __FORMAT_INSTRUCTIONS_DICT: typing.ClassVar[
+        FormatInstructionsDict
+    ] = types.MappingProxyType(dict(_DSS_PUBLIC_FIELDS))
 
     @classmethod
     def get_format_instructions_dict(cls) -> FormatInstructionsDict:
-        return types.MappingProxyType(
-            DSSPublicKeyParams.__FORMAT_INSTRUCTIONS_DICT
-        )
+        return cls.__FORMAT_INSTRUCTIONS_DICT
 
     @classmethod
     def conversion_functions(
@@ -69,36 +118,89 @@ class DSSPublicKeyParams(PublicKeyParams):
             to functions that take key objects of these types and return
             parameter values.
         """
-        def dsa_public_key_convert_from_cryptography(
-            key_object: dsa.DSAPublicKey
-        ) -> ValuesDict:
-            public_numbers = key_object.public_numbers()
-            parameter_numbers = public_numbers.parameter_numbers
-            return {
-                'p': parameter_numbers.p,
-                'q': parameter_numbers.q,
-                'g': parameter_numbers.g,
-                'y': public_numbers.y,
-            }
-
-        def dsa_public_key_convert_to_cryptography(
-            key_params: ValuesDict
-        ) -> dsa.DSAPublicKey:
-            return dsa.DSAPublicNumbers(
-                key_params['y'],
-                dsa.DSAParameterNumbers(
-                    key_params['p'],
-                    key_params['q'],
-                    key_params['g']
-                )
-            ).public_key()
-
-        return {
-            dsa.DSAPublicKey: ConversionFunctions(
-                dsa_public_key_convert_from_cryptography,
-                dsa_public_key_convert_to_cryptography
+        return _DSA_PUBLIC_KEY_CONVERSION_FUNCTIONS
+
+
+_DER_INTEGER_TAG = b'\x02'
+_DER_SEQUENCE_TAG = b'\x30'
+# The version field of DSAPrivateKey, the INTEGER 0
+_DER_DSA_PRIVATE_KEY_VERSION = b'\x02\x01\x00'
+
+
+def _der_encode_length(length: int) -> bytes:
+    if length < 0x80:
+        return bytes((length,))
+    length_bytes = length.to_bytes((length.bit_length() + 7) // 8, 'big')
+    return bytes((0x80 | len(length_bytes),)) + length_bytes
+
+
+def _dsa_private_key_der(key_params: ValuesDict) -> bytes:
+    """The DER encoding of the OpenSSL ``DSAPrivateKey`` structure, i.e.
+    ``SEQUENCE { version, p, q, g, y, x }``, for the given parameter values.
+    """
+    parts = [_DER_DSA_PRIVATE_KEY_VERSION]
+    for name, _ in _DSS_PRIVATE_FIELDS:
+        value = key_params[name]
+        value_bytes = value.to_bytes(
+            value.bit_length() // 8 + 1,
+            'big',
+            signed=True
+        )
+        parts.append(_DER_INTEGER_TAG + _der_encode_length(len(value_bytes)))
+        parts.append(value_bytes)
+    contents = b''.join(parts)
+    return _DER_SEQUENCE_TAG + _der_encode_length(len(contents)) + contents
+
+
+def _dsa_private_key_convert_from_cryptography(
+    key_object: dsa.DSAPrivateKey
+) -> ValuesDict:
+    private_numbers = key_object.private_numbers()
+    public_numbers = private_numbers.public_numbers
+    parameter_numbers = public_numbers.parameter_numbers
+    return {
+        'p': parameter_numbers.p,
+        'q': parameter_numbers.q,
+        'g': parameter_numbers.g,
+        'y': public_numbers.y,
+        'x': private_numbers.x,
+    }
+
+
+def _dsa_private_key_convert_to_cryptography(
+    key_params: ValuesDict
+) -> dsa.DSAPrivateKey:
+    # Read from the parameters object, so that subclasses can override it
+    if getattr(key_params, 'SKIP_CONSISTENCY_CHECK', False):
+        return typing.cast(
+            dsa.DSAPrivateKey,
+            serialization.load_der_private_key(
+                _dsa_private_key_der(key_params),
+                None
             )
-        }
+        )
+    return dsa.DSAPrivateNumbers(
+        key_params['x'],
+        dsa.DSAPublicNumbers(
+            key_params['y'],
+            dsa.DSAParameterNumbers(
+                key_params['p'],
+                key_params['q'],
+                key_params['g']
+            )
+        )
+    ).private_key()
+
+
+_DSA_PRIVATE_KEY_CONVERSION_FUNCTIONS: typing.Mapping[
+    typing.Type[typing.Any],
+    ConversionFunctions
+] = types.MappingProxyType({
+    dsa.DSAPrivateKey: ConversionFunctions(
+        _dsa_private_key_convert_from_cryptography,
+        _dsa_private_key_convert_to_cryptography
+    )
+})
 
 
 DSSPrivateKeyParamsTypeVar = typing.TypeVar(
@@ -135,19 +237,15 @@ class DSSPrivateKeyParams(PrivateKeyParams, DSSPublicKeyParams):
             ``params`` or does not have the correct type.
     """
 
-    __FORMAT_INSTRUCTIONS_DICT: typing.ClassVar[FormatInstructionsDict] = {
-        'p': PascalStyleFormatInstruction.MPINT,
-        'q': PascalStyleFormatInstruction.MPINT,
-        'g': PascalStyleFormatInstruction.MPINT,
-        'y': PascalStyleFormatInstruction.MPINT,
-        'x': PascalStyleFormatInstruction.MPINT,
-    }
+    __slots__ = ()
+
+    __FORMAT_INSTRUCTIONS_DICT: typing.ClassVar[
+        FormatInstructionsDict
+    ] = types.MappingProxyType(dict(_DSS_PRIVATE_FIELDS))
 
     @classmethod
     def get_format_instructions_dict(cls) -> FormatInstructionsDict:
-        return types.MappingProxyType(
-            DSSPrivateKeyParams.__FORMAT_INSTRUCTIONS_DICT
-        )
+        return cls.__FORMAT_INSTRUCTIONS_DICT
 
     @staticmethod
     def get_key_size() -> int:
@@ -161,6 +259,17 @@ class DSSPrivateKeyParams(PrivateKeyParams, DSSPublicKeyParams):
     The value 1024, the key size, in bits, of a DSS key.
     """
 
+    SKIP_CONSISTENCY_CHECK: typing.ClassVar[bool] = False
+    """
+    Whether to skip checking that the parameter values form a consistent DSA
+    key (for example, that ``y`` is ``g^x mod p``) when converting to a
+    :any:`cryptography.hazmat.primitives.asymmetric.dsa.DSAPrivateKey`.
+
+    Skipping the check makes the conversion much faster, which matters when
+    converting many keys in bulk, but an inconsistent key is then not
+    detected. Only set this for keys from a trusted source.
+    """
+
     @classmethod
     def generate_private_params(
         cls: typing.Type[DSSPrivateKeyParamsTypeVar],
@@ -169,22 +278,33 @@ class DSSPrivateKeyParams(PrivateKeyParams, DSSPublicKeyParams):
         """Constructs and initializes a DSS private key parameters object
         with generated values.
 
+        Generating the DSA parameters ``p``, ``q`` and ``g`` is by far the
+        most expensive part of generating a key. Callers that generate many
+        keys that may share parameters, such as tests, can generate the
+        parameters once and pass them in.
+
         Args:
             kwargs
                 Keyword arguments consumed to generate parameter values.
 
         Returns:
             A private key parameters object with generated values valid for
-            a DSS private key (the key size is 128 bytes).
+            a DSS private key (the key size is 128 bytes). If
+            ``kwargs['parameters']`` is given, the key is generated from
+            these DSA parameters; otherwise, new DSA parameters are
+            generated for the key.
         """
 
-        private_key = dsa.generate_private_key(cls.KEY_SIZE)
+        if 'parameters' in kwargs:
+            private_key = kwargs['parameters'].generate_private_key()
+        else:
+            private_key = dsa.generate_private_key(cls.KEY_SIZE)
 
         private_numbers = private_key.private_numbers()
         public_numbers = private_numbers.public_numbers
         parameter_numbers = public_numbers.parameter_numbers
 
-        return cls({
+        return cls._from_trusted_params({
             'p': parameter_numbers.p,
             'q': parameter_numbers.q,
             'g': parameter_numbers.g,
@@ -192,6 +312,28 @@ class DSSPrivateKeyParams(PrivateKeyParams, DSSPublicKeyParams):
             'x': private_numbers.x,
         })
 
+    def to_public(self) -> DSSPublicKeyParams:
+        """Constructs a DSS public key parameters object from the public
+        parameter values of this object.
+
+        The values are copied as they are, without constructing a
+        :any:`cryptography.hazmat.primitives.asymmetric.dsa.DSAPublicKey`,
+        so no key arithmetic is performed.
+
+        Returns:
+            A public key parameters object with the values of ``p``, ``q``,
+            ``g`` and ``y`` in this object.
+
+        Raises:
+            UserWarning: A parameter value from the above list is missing
+                from this object or does not have the correct type.
+        """
+        return DSSPublicKeyParams({
+            name: self[name]
+            for name, _ in _DSS_PUBLIC_FIELDS
+            if name in self
+        })
+
     @classmethod
     def conversion_functions(
         cls
@@ -208,38 +350,4 @@ class DSSPrivateKeyParams(PrivateKeyParams, DSSPublicKeyParams):
             to functions that take key objects of these types and return
             parameter values.
         """
-        def dsa_private_key_convert_from_cryptography(
-            key_object: dsa.DSAPrivateKey
-        ) -> ValuesDict:
-            private_numbers = key_object.private_numbers()
-            public_numbers = private_numbers.public_numbers
-            parameter_numbers = public_numbers.parameter_numbers
-            return {
-                'p': parameter_numbers.p,
-                'q': parameter_numbers.q,
-                'g': parameter_numbers.g,
-                'y': public_numbers.y,
-                'x': private_numbers.x,
-            }
-
-        def dsa_private_key_convert_to_cryptography(
-            key_params: ValuesDict
-        ) -> dsa.DSAPrivateKey:
-            return dsa.DSAPrivateNumbers(
-                key_params['x'],
-                dsa.DSAPublicNumbers(
-                    key_params['y'],
-                    dsa.DSAParameterNumbers(
-                        key_params['p'],
-                        key_params['q'],
-                        key_params['g']
-                    )
-                )
-            ).private_key()
-
-        return {
-            dsa.DSAPrivateKey: ConversionFunctions(
-                dsa_private_key_convert_from_cryptography,
-                dsa_private_key_convert_to_cryptography
-            )
-        }
+        return _DSA_PRIVATE_KEY_CONVERSION_FUNCTIONS
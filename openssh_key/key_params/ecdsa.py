@@ -3,13 +3,13 @@ Classes representing ECDSA keys.
 """
 
 import abc
+import functools
 import types
 import typing
 import warnings
 
 from cryptography.hazmat.primitives.asymmetric import ec
 from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
-from cryptography.x509.oid import ObjectIdentifier
 from openssh_key import utils
 from openssh_key.pascal_style_byte_stream import (FormatInstructionsDict,
                                                   PascalStyleFormatInstruction,
@@ -18,6 +18,36 @@ from openssh_key.pascal_style_byte_stream import (FormatInstructionsDict,
 from .common import ConversionFunctions, PrivateKeyParams, PublicKeyParams
 
 
+def _ecdsa_public_key_convert_from_cryptography(
+    cls: typing.Type['ECDSAPublicKeyParams'],
+    key_object: ec.EllipticCurvePublicKey
+) -> typing.Optional[ValuesDict]:
+    if key_object.curve.name != cls.CURVE_NAME:
+        return None
+    public_bytes = key_object.public_bytes(
+        Encoding.X962, PublicFormat.UncompressedPoint
+    )
+    return {
+        'identifier': cls.CURVE_IDENTIFIER,
+        'q': public_bytes,
+    }
+
+
+def _ecdsa_public_key_convert_to_cryptography(
+    cls: typing.Type['ECDSAPublicKeyParams'],
+    key_params: ValuesDict
+) -> typing.Optional[ec.EllipticCurvePublicKey]:
+    if key_params['identifier'] != cls.CURVE_IDENTIFIER:
+        raise NotImplementedError(
+            'The curve identifier encoded in the public key does not '
+            'correspond to the key type'
+        )
+    return ec.EllipticCurvePublicKey.from_encoded_point(
+        cls.get_curve(),
+        key_params['q']
+    )
+
+
 class ECDSAPublicKeyParams(PublicKeyParams, abc.ABC):
     """The parameters comprising a key in the Elliptic Curve Digital Signature
     Algorithm cryptosystem.
@@ -41,16 +71,39 @@ class ECDSAPublicKeyParams(PublicKeyParams, abc.ABC):
         UserWarning: A parameter value from the above list is missing from
             ``params`` or does not have the correct type.
     """
-    __FORMAT_INSTRUCTIONS_DICT: typing.ClassVar[FormatInstructionsDict] = {
+
+    __slots__ = ()
+
+    __FORMAT_INSTRUCTIONS_DICT: typing.ClassVar[
+        FormatInstructionsDict
+    ] = types.MappingProxyType({
         'identifier': PascalStyleFormatInstruction.STRING,
         'q': PascalStyleFormatInstruction.BYTES,
-    }
+    })
 
     @classmethod
     def get_format_instructions_dict(cls) -> FormatInstructionsDict:
-        return types.MappingProxyType(
-            ECDSAPublicKeyParams.__FORMAT_INSTRUCTIONS_DICT
-        )
+        return cls.__FORMAT_INSTRUCTIONS_DICT
+
+    __PUBLIC_KEY_CONVERSION_FUNCTIONS: typing.ClassVar[typing.Mapping[
+        typing.Type[typing.Any],
+        ConversionFunctions
+    ]] = types.MappingProxyType({})
+
+    def __init_subclass__(cls, **kwargs: typing.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # The conversion functions depend on the curve of the class, so they
+        # are bound to each subclass once, when it is defined
+        cls.__PUBLIC_KEY_CONVERSION_FUNCTIONS = types.MappingProxyType({
+            ec.EllipticCurvePublicKey: ConversionFunctions(
+                functools.partial(
+                    _ecdsa_public_key_convert_from_cryptography, cls
+                ),
+                functools.partial(
+                    _ecdsa_public_key_convert_to_cryptography, cls
+                )
+            )
+        })
 
     @staticmethod
     @abc.abstractmethod
@@ -94,16 +147,29 @@ class ECDSAPublicKeyParams(PublicKeyParams, abc.ABC):
     """
 
     @classmethod
-    def convert_from(cls, key_object: typing.Any) -> 'PublicKeyParams':
+    @functools.lru_cache(maxsize=None)
+    def get_curve(cls) -> ec.EllipticCurve:
+        """The elliptic curve domain parameters identified by ``CURVE_OID``,
+        constructed once per class.
+        """
+        # Imported here rather than at module level, since importing
+        # cryptography.x509 accounts for much of this package's import time.
+        from cryptography.x509.oid import ObjectIdentifier
+        return ec.get_curve_for_oid(ObjectIdentifier(cls.CURVE_OID))()
+
+    @classmethod
+    def iter_conversion_classes(
+        cls
+    ) -> typing.Iterator[typing.Tuple[
+        typing.Type[PublicKeyParams],
+        typing.Type[PublicKeyParams]
+    ]]:
         if utils.is_abstract(cls):
             for subcls in cls.__subclasses__():
                 if utils.is_abstract(subcls):  # Direct descendant classes only
                     continue
-                try:
-                    return subcls.convert_from(key_object)
-                except NotImplementedError:
-                    pass
-        return super().convert_from(key_object)
+                yield from subcls.iter_conversion_classes()
+        yield from super().iter_conversion_classes()
 
     @classmethod
     def conversion_functions(
@@ -121,38 +187,7 @@ class ECDSAPublicKeyParams(PublicKeyParams, abc.ABC):
             to functions that take key objects of these types and return
             parameter values.
         """
-        def ecdsa_public_key_convert_from_cryptography(
-            key_object: ec.EllipticCurvePublicKey
-        ) -> typing.Optional[ValuesDict]:
-            if key_object.curve.name != cls.CURVE_NAME:
-                return None
-            public_bytes = key_object.public_bytes(
-                Encoding.X962, PublicFormat.UncompressedPoint
-            )
-            return {
-                'identifier': cls.CURVE_IDENTIFIER,
-                'q': public_bytes,
-            }
-
-        def ecdsa_public_key_convert_to_cryptography(
-            key_params: ValuesDict
-        ) -> typing.Optional[ec.EllipticCurvePublicKey]:
-            if key_params['identifier'] != cls.CURVE_IDENTIFIER:
-                raise NotImplementedError(
-                    'The curve identifier encoded in the public key does not '
-                    'correspond to the key type'
-                )
-            return ec.EllipticCurvePublicKey.from_encoded_point(
-                ec.get_curve_for_oid(ObjectIdentifier(cls.CURVE_OID))(),
-                key_params['q']
-            )
-
-        return {
-            ec.EllipticCurvePublicKey: ConversionFunctions(
-                ecdsa_public_key_convert_from_cryptography,
-                ecdsa_public_key_convert_to_cryptography
-            )
-        }
+        return cls.__PUBLIC_KEY_CONVERSION_FUNCTIONS
 
     def check_params_are_valid(self) -> None:
         """Checks whether the values within this parameters object conform to
@@ -180,7 +215,7 @@ class ECDSAPublicKeyParams(PublicKeyParams, abc.ABC):
         try:
             # Discard result
             ec.EllipticCurvePublicKey.from_encoded_point(
-                ec.get_curve_for_oid(ObjectIdentifier(self.CURVE_OID))(),
+                self.get_curve(),
                 self['q']
             )
         except ValueError:
@@ -190,6 +225,36 @@ class ECDSAPublicKeyParams(PublicKeyParams, abc.ABC):
             ))
 
 
+def _ecdsa_private_key_convert_from_cryptography(
+    cls: typing.Type['ECDSAPrivateKeyParams'],
+    key_object: ec.EllipticCurvePrivateKey
+) -> typing.Optional[ValuesDict]:
+    if key_object.curve.name != cls.CURVE_NAME:
+        return None
+    private_numbers = key_object.private_numbers()
+    public_bytes = key_object.public_key().public_bytes(
+        Encoding.X962, PublicFormat.UncompressedPoint
+    )
+    return {
+        'identifier': cls.CURVE_IDENTIFIER,
+        'q': public_bytes,
+        'd': private_numbers.private_value,
+    }
+
+
+def _ecdsa_private_key_convert_to_cryptography(
+    cls: typing.Type['ECDSAPrivateKeyParams'],
+    key_params: ValuesDict
+) -> ec.EllipticCurvePrivateKey:
+    return ec.EllipticCurvePrivateNumbers(
+        key_params['d'],
+        ec.EllipticCurvePublicKey.from_encoded_point(
+            cls.get_curve(),
+            key_params['q']
+        ).public_numbers()
+    ).private_key()
+
+
 ECDSAPrivateKeyParamsTypeVar = typing.TypeVar(
     'ECDSAPrivateKeyParamsTypeVar',
     bound='ECDSAPrivateKeyParams'
@@ -221,17 +286,36 @@ class ECDSAPrivateKeyParams(PrivateKeyParams, ECDSAPublicKeyParams):
             ``params`` or does not have the correct type.
     """
 
-    __FORMAT_INSTRUCTIONS_DICT: typing.ClassVar[FormatInstructionsDict] = {
-        'identifier': PascalStyleFormatInstruction.STRING,
-        'q': PascalStyleFormatInstruction.BYTES,
+    __slots__ = ()
+
+    __FORMAT_INSTRUCTIONS_DICT: typing.ClassVar[
+        FormatInstructionsDict
+    ] = types.MappingProxyType({
+        **ECDSAPublicKeyParams.get_format_instructions_dict(),
         'd': PascalStyleFormatInstruction.MPINT,
-    }
+    })
 
     @classmethod
     def get_format_instructions_dict(cls) -> FormatInstructionsDict:
-        return types.MappingProxyType(
-            ECDSAPrivateKeyParams.__FORMAT_INSTRUCTIONS_DICT
-        )
+        return cls.__FORMAT_INSTRUCTIONS_DICT
+
+    __PRIVATE_KEY_CONVERSION_FUNCTIONS: typing.ClassVar[typing.Mapping[
+        typing.Type[typing.Any],
+        ConversionFunctions
+    ]] = types.MappingProxyType({})
+
+    def __init_subclass__(cls, **kwargs: typing.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.__PRIVATE_KEY_CONVERSION_FUNCTIONS = types.MappingProxyType({
+            ec.EllipticCurvePrivateKey: ConversionFunctions(
+                functools.partial(
+                    _ecdsa_private_key_convert_from_cryptography, cls
+                ),
+                functools.partial(
+                    _ecdsa_private_key_convert_to_cryptography, cls
+                )
+            )
+        })
 
     @classmethod
     def generate_private_params(
@@ -260,9 +344,9 @@ class ECDSAPrivateKeyParams(PrivateKeyParams, ECDSAPublicKeyParams):
             )
 
         private_key = ec.generate_private_key(
-            curve=ec.get_curve_for_oid(ObjectIdentifier(cls.CURVE_OID))()
+            curve=cls.get_curve()
         )
-        return cls({
+        return cls._from_trusted_params({
             'identifier': cls.CURVE_IDENTIFIER,
             'q': private_key.public_key().public_bytes(
                 Encoding.X962, PublicFormat.UncompressedPoint
@@ -286,38 +370,7 @@ class ECDSAPrivateKeyParams(PrivateKeyParams, ECDSAPublicKeyParams):
             to functions that take key objects of these types and return
             parameter values.
         """
-        def ecdsa_private_key_convert_from_cryptography(
-            key_object: ec.EllipticCurvePrivateKey
-        ) -> typing.Optional[ValuesDict]:
-            if key_object.curve.name != cls.CURVE_NAME:
-                return None
-            private_numbers = key_object.private_numbers()
-            public_bytes = key_object.public_key().public_bytes(
-                Encoding.X962, PublicFormat.UncompressedPoint
-            )
-            return {
-                'identifier': cls.CURVE_IDENTIFIER,
-                'q': public_bytes,
-                'd': private_numbers.private_value,
-            }
-
-        def ecdsa_private_key_convert_to_cryptography(
-            key_params: ValuesDict
-        ) -> ec.EllipticCurvePrivateKey:
-            return ec.EllipticCurvePrivateNumbers(
-                key_params['d'],
-                ec.EllipticCurvePublicKey.from_encoded_point(
-                    ec.get_curve_for_oid(ObjectIdentifier(cls.CURVE_OID))(),
-                    key_params['q']
-                ).public_numbers()
-            ).private_key()
-
-        return {
-            ec.EllipticCurvePrivateKey: ConversionFunctions(
-                ecdsa_private_key_convert_from_cryptography,
-                ecdsa_private_key_convert_to_cryptography
-            )
-        }
+        return cls.__PRIVATE_KEY_CONVERSION_FUNCTIONS
 
 
 class ECDSA_NISTP256_PublicKeyParams(ECDSAPublicKeyParams):
@@ -325,6 +378,8 @@ class ECDSA_NISTP256_PublicKeyParams(ECDSAPublicKeyParams):
     The parameters representing a public ECDSA key on the ``nistp256`` curve.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def get_curve_identifier() -> str:
         """The value ``'nistp256'``.
@@ -349,12 +404,16 @@ class ECDSA_NISTP256_PrivateKeyParams(ECDSA_NISTP256_PublicKeyParams, ECDSAPriva
     The parameters representing a private ECDSA key on the ``nistp256`` curve.
     """
 
+    __slots__ = ()
+
 
 class ECDSA_NISTP384_PublicKeyParams(ECDSAPublicKeyParams):
     """
     The parameters representing a public ECDSA key on the ``nistp384`` curve.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def get_curve_identifier() -> str:
         """The value ``'nistp384'``.
@@ -379,12 +438,16 @@ class ECDSA_NISTP384_PrivateKeyParams(ECDSA_NISTP384_PublicKeyParams, ECDSAPriva
     The parameters representing a private ECDSA key on the ``nistp384`` curve.
     """
 
+    __slots__ = ()
+
 
 class ECDSA_NISTP521_PublicKeyParams(ECDSAPublicKeyParams):
     """
     The parameters representing a public ECDSA key on the ``nistp521`` curve.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def get_curve_identifier() -> str:
         """The value ``'nistp521'``.
@@ -408,3 +471,5 @@ class ECDSA_NISTP521_PrivateKeyParams(ECDSA_NISTP521_PublicKeyParams, ECDSAPriva
     """
     The parameters representing a private ECDSA key on the ``nistp521`` curve.
     """
+
+    __slots__ = ()
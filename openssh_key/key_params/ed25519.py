@@ -15,6 +15,80 @@ from openssh_key.pascal_style_byte_stream import (FormatInstructionsDict,
 
 from .common import ConversionFunctions, PrivateKeyParams, PublicKeyParams
 
+try:
+    import nacl.signing
+    _NACL_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    _NACL_AVAILABLE = False
+
+
+def _ed25519_public_key_convert_from_cryptography(
+    key_object: cryptography_ed25519.Ed25519PublicKey
+) -> ValuesDict:
+    return {
+        'public': key_object.public_bytes(
+            encoding=serialization.Encoding.Raw,
+            format=serialization.PublicFormat.Raw
+        )
+    }
+
+
+def _ed25519_public_key_convert_to_cryptography(
+    key_params: ValuesDict
+) -> cryptography_ed25519.Ed25519PublicKey:
+    return cryptography_ed25519.Ed25519PublicKey.from_public_bytes(
+        key_params['public']
+    )
+
+
+def _ed25519_public_key_convert_from_bytes(
+    key_object: bytes
+) -> ValuesDict:
+    return {
+        'public': key_object
+    }
+
+
+def _ed25519_public_key_convert_to_bytes(
+    key_params: ValuesDict
+) -> bytes:
+    return bytes(key_params['public'])
+
+
+if _NACL_AVAILABLE:
+    def _ed25519_public_key_convert_from_pynacl(
+        key_object: nacl.signing.VerifyKey
+    ) -> ValuesDict:
+        return {
+            'public': bytes(key_object)
+        }
+
+    def _ed25519_public_key_convert_to_pynacl(
+        key_params: ValuesDict
+    ) -> nacl.signing.VerifyKey:
+        return nacl.signing.VerifyKey(key_params['public'])
+
+
+_ED25519_PUBLIC_KEY_CONVERSION_FUNCTIONS: typing.Mapping[
+    typing.Type[typing.Any],
+    ConversionFunctions
+] = types.MappingProxyType({
+    cryptography_ed25519.Ed25519PublicKey: ConversionFunctions(
+        _ed25519_public_key_convert_from_cryptography,
+        _ed25519_public_key_convert_to_cryptography
+    ),
+    bytes: ConversionFunctions(
+        _ed25519_public_key_convert_from_bytes,
+        _ed25519_public_key_convert_to_bytes
+    ),
+    **({
+        nacl.signing.VerifyKey: ConversionFunctions(
+            _ed25519_public_key_convert_from_pynacl,
+            _ed25519_public_key_convert_to_pynacl
+        )
+    } if _NACL_AVAILABLE else {})
+})
+
 
 class Ed25519PublicKeyParams(PublicKeyParams):
     """The parameters comprising a key in the Edwards-curve Digital Signature
@@ -35,15 +109,18 @@ class Ed25519PublicKeyParams(PublicKeyParams):
             ``params`` or does not have the correct type, or the key size is
             not valid for Ed25519 (32 bytes).
     """
-    __FORMAT_INSTRUCTIONS_DICT: typing.ClassVar[FormatInstructionsDict] = {
+
+    __slots__ = ()
+
+    __FORMAT_INSTRUCTIONS_DICT: typing.ClassVar[
+        FormatInstructionsDict
+    ] = types.MappingProxyType({
         'public': PascalStyleFormatInstruction.BYTES
-    }
+    })
 
     @classmethod
     def get_format_instructions_dict(cls) -> FormatInstructionsDict:
-        return types.MappingProxyType(
-            Ed25519PublicKeyParams.__FORMAT_INSTRUCTIONS_DICT
-        )
+        return cls.__FORMAT_INSTRUCTIONS_DICT
 
     @staticmethod
     def get_key_size() -> int:
@@ -91,74 +168,104 @@ class Ed25519PublicKeyParams(PublicKeyParams):
             to functions that take key objects of these types and return
             parameter values.
         """
-        def ed25519_public_key_convert_from_cryptography(
-            key_object: cryptography_ed25519.Ed25519PublicKey
-        ) -> ValuesDict:
-            return {
-                'public': key_object.public_bytes(
-                    encoding=serialization.Encoding.Raw,
-                    format=serialization.PublicFormat.Raw
-                )
-            }
-
-        def ed25519_public_key_convert_to_cryptography(
-            key_params: ValuesDict
-        ) -> cryptography_ed25519.Ed25519PublicKey:
-            return cryptography_ed25519.Ed25519PublicKey.from_public_bytes(
-                key_params['public']
-            )
+        return _ED25519_PUBLIC_KEY_CONVERSION_FUNCTIONS
 
-        def ed25519_public_key_convert_from_bytes(
-            key_object: bytes
-        ) -> ValuesDict:
-            return {
-                'public': key_object
-            }
-
-        def ed25519_public_key_convert_to_bytes(
-            key_params: ValuesDict
-        ) -> bytes:
-            return bytes(key_params['public'])
-
-        conversion_functions_dict: typing.MutableMapping[
-            typing.Type[typing.Any],
-            ConversionFunctions
-        ] = {
-            cryptography_ed25519.Ed25519PublicKey: ConversionFunctions(
-                ed25519_public_key_convert_from_cryptography,
-                ed25519_public_key_convert_to_cryptography
-            ),
-            bytes: ConversionFunctions(
-                ed25519_public_key_convert_from_bytes,
-                ed25519_public_key_convert_to_bytes
-            )
-        }
 
-        try:
-            import nacl
-
-            def ed25519_public_key_convert_from_pynacl(
-                key_object: nacl.signing.VerifyKey
-            ) -> ValuesDict:
-                return {
-                    'public': bytes(key_object)
-                }
-
-            def ed25519_public_key_convert_to_pynacl(
-                key_params: ValuesDict
-            ) -> nacl.signing.VerifyKey:
-                return nacl.signing.VerifyKey(key_params['public'])
-
-            conversion_functions_dict[
-                nacl.signing.VerifyKey
-            ] = ConversionFunctions(
-                ed25519_public_key_convert_from_pynacl,
-                ed25519_public_key_convert_to_pynacl
-            )
-        except ImportError:
-            pass
+def _create_private_params_dict(
+    private_bytes: bytes,
+    public_bytes: bytes
+) -> ValuesDict:
+    return {
+        'public': public_bytes,
+        'private_public': private_bytes + public_bytes
+    }
+
+
+def _ed25519_private_key_convert_from_cryptography(
+    key_object: cryptography_ed25519.Ed25519PrivateKey
+) -> ValuesDict:
+    private_bytes = key_object.private_bytes(
+        encoding=serialization.Encoding.Raw,
+        format=serialization.PrivateFormat.Raw,
+        encryption_algorithm=serialization.NoEncryption()
+    )
+    public_bytes = key_object.public_key().public_bytes(
+        encoding=serialization.Encoding.Raw,
+        format=serialization.PublicFormat.Raw
+    )
+    return _create_private_params_dict(private_bytes, public_bytes)
+
+
+def _ed25519_private_key_convert_to_cryptography(
+    key_params: ValuesDict
+) -> cryptography_ed25519.Ed25519PrivateKey:
+    return cryptography_ed25519.Ed25519PrivateKey.from_private_bytes(
+        memoryview(
+            key_params['private_public']
+        )[:Ed25519PrivateKeyParams.KEY_SIZE]
+    )
+
+
+def _ed25519_private_key_convert_from_bytes(
+    key_object: bytes
+) -> ValuesDict:
+    private_bytes = key_object
+    public_bytes = cryptography_ed25519.Ed25519PrivateKey.from_private_bytes(
+        key_object
+    ).public_key().public_bytes(
+        encoding=serialization.Encoding.Raw,
+        format=serialization.PublicFormat.Raw
+    )
+    return _create_private_params_dict(private_bytes, public_bytes)
+
+
+def _ed25519_private_key_convert_to_bytes(
+    key_params: ValuesDict
+) -> bytes:
+    return bytes(
+        memoryview(
+            key_params['private_public']
+        )[:Ed25519PrivateKeyParams.KEY_SIZE]
+    )
+
+
+if _NACL_AVAILABLE:
+    def _ed25519_private_key_convert_from_pynacl(
+        key_object: nacl.signing.SigningKey
+    ) -> ValuesDict:
+        private_bytes = bytes(key_object)
+        public_bytes = bytes(key_object.verify_key)
+        return _create_private_params_dict(private_bytes, public_bytes)
+
+    def _ed25519_private_key_convert_to_pynacl(
+        key_params: ValuesDict
+    ) -> nacl.signing.SigningKey:
+        return nacl.signing.SigningKey(
+            key_params[
+                'private_public'
+            ][:Ed25519PrivateKeyParams.KEY_SIZE]
+        )
+
 
-        return conversion_functions_dict
+_ED25519_PRIVATE_KEY_CONVERSION_FUNCTIONS: typing.Mapping[
+    typing.Type[typing.Any],
+    ConversionFunctions
+] = types.MappingProxyType({
+    cryptography_ed25519.Ed25519PrivateKey: ConversionFunctions(
+        _ed25519_private_key_convert_from_cryptography,
+        _ed25519_private_key_convert_to_cryptography
+    ),
+    bytes: ConversionFunctions(
+        _ed25519_private_key_convert_from_bytes,
+        _ed25519_private_key_convert_to_bytes
+    ),
+    **({
+        nacl.signing.SigningKey: ConversionFunctions(
+            _ed25519_private_key_convert_from_pynacl,
+            _ed25519_private_key_convert_to_pynacl
+        )
+    } if _NACL_AVAILABLE else {})
+})
 
 
 Ed25519PrivateKeyParamsTypeVar = typing.TypeVar(
@@ -191,16 +298,18 @@ class Ed25519PrivateKeyParams(PrivateKeyParams, Ed25519PublicKeyParams):
             parameter value.
     """
 
-    __FORMAT_INSTRUCTIONS_DICT: typing.ClassVar[FormatInstructionsDict] = {
-        'public': PascalStyleFormatInstruction.BYTES,
+    __slots__ = ()
+
+    __FORMAT_INSTRUCTIONS_DICT: typing.ClassVar[
+        FormatInstructionsDict
+    ] = types.MappingProxyType({
+        **Ed25519PublicKeyParams.get_format_instructions_dict(),
         'private_public': PascalStyleFormatInstruction.BYTES
-    }
+    })
 
     @classmethod
     def get_format_instructions_dict(cls) -> FormatInstructionsDict:
-        return types.MappingProxyType(
-            Ed25519PrivateKeyParams.__FORMAT_INSTRUCTIONS_DICT
-        )
+        return cls.__FORMAT_INSTRUCTIONS_DICT
 
     def check_params_are_valid(self) -> None:
         """Checks whether the values within this parameters object conform to
@@ -219,10 +328,10 @@ class Ed25519PrivateKeyParams(PrivateKeyParams, Ed25519PublicKeyParams):
         if 'private_public' not in self or type(self['private_public']) != bytes \
                 or 'public' not in self or type(self['public']) != bytes:
             return
-        if self['private_public'][self.KEY_SIZE:] \
-                != self['public']:
+        private_public = memoryview(self['private_public'])
+        if private_public[self.KEY_SIZE:] != self['public']:
             warnings.warn('Public key does not match')
-        if len(self['private_public'][self.KEY_SIZE:]) != self.KEY_SIZE:
+        if len(private_public) - self.KEY_SIZE != self.KEY_SIZE:
             warnings.warn(
                 'Private key not of length ' + str(self.KEY_SIZE)
             )
@@ -258,10 +367,9 @@ class Ed25519PrivateKeyParams(PrivateKeyParams, Ed25519PublicKeyParams):
             format=serialization.PublicFormat.Raw
         )
 
-        return cls({
-            'public': public_bytes,
-            'private_public': private_bytes + public_bytes
-        })
+        return cls._from_trusted_params(
+            _create_private_params_dict(private_bytes, public_bytes)
+        )
 
     @classmethod
     def conversion_functions(
@@ -281,99 +389,4 @@ class Ed25519PrivateKeyParams(PrivateKeyParams, Ed25519PublicKeyParams):
             to functions that take key objects of these types and return
             parameter values.
         """
-        def ed25519_private_key_convert_from_cryptography(
-            key_object: cryptography_ed25519.Ed25519PrivateKey
-        ) -> ValuesDict:
-            private_bytes = key_object.private_bytes(
-                encoding=serialization.Encoding.Raw,
-                format=serialization.PrivateFormat.Raw,
-                encryption_algorithm=serialization.NoEncryption()
-            )
-            public_bytes = key_object.public_key().public_bytes(
-                encoding=serialization.Encoding.Raw,
-                format=serialization.PublicFormat.Raw
-            )
-            return {
-                'public': public_bytes,
-                'private_public': private_bytes + public_bytes
-            }
-
-        def ed25519_private_key_convert_to_cryptography(
-            key_params: ValuesDict
-        ) -> cryptography_ed25519.Ed25519PrivateKey:
-            return cryptography_ed25519.Ed25519PrivateKey.from_private_bytes(
-                key_params[
-                    'private_public'
-                ][:Ed25519PrivateKeyParams.KEY_SIZE]
-            )
-
-        def ed25519_private_key_convert_from_bytes(
-            key_object: bytes
-        ) -> ValuesDict:
-            private_bytes = key_object
-            public_bytes = cryptography_ed25519.Ed25519PrivateKey.from_private_bytes(
-                key_object
-            ).public_key().public_bytes(
-                encoding=serialization.Encoding.Raw,
-                format=serialization.PublicFormat.Raw
-            )
-            return {
-                'public': public_bytes,
-                'private_public': private_bytes + public_bytes
-            }
-
-        def ed25519_private_key_convert_to_bytes(
-            key_params: ValuesDict
-        ) -> bytes:
-            return bytes(
-                key_params[
-                    'private_public'
-                ][: Ed25519PrivateKeyParams.KEY_SIZE]
-            )
-
-        conversion_functions_dict: typing.MutableMapping[
-            typing.Type[typing.Any],
-            ConversionFunctions
-        ] = {
-            cryptography_ed25519.Ed25519PrivateKey: ConversionFunctions(
-                ed25519_private_key_convert_from_cryptography,
-                ed25519_private_key_convert_to_cryptography
-            ),
-            bytes: ConversionFunctions(
-                ed25519_private_key_convert_from_bytes,
-                ed25519_private_key_convert_to_bytes
-            )
-        }
-
-        try:
-            import nacl
-
-            def ed25519_private_key_convert_from_pynacl(
-                key_object: nacl.signing.SigningKey
-            ) -> ValuesDict:
-                private_bytes = bytes(key_object)
-                public_bytes = bytes(key_object.verify_key)
-                return {
-                    'public': public_bytes,
-                    'private_public': private_bytes + public_bytes
-                }
-
-            def ed25519_private_key_convert_to_pynacl(
-                key_params: ValuesDict
-            ) -> nacl.signing.SigningKey:
-                return nacl.signing.SigningKey(
-                    key_params[
-                        'private_public'
-                    ][:Ed25519PrivateKeyParams.KEY_SIZE]
-                )
-
-            conversion_functions_dict[
-                nacl.signing.SigningKey
-            ] = ConversionFunctions(
-                ed25519_private_key_convert_from_pynacl,
-                ed25519_private_key_convert_to_pynacl
-            )
-        except ImportError:
-            pass
-
-        return conversion_functions_dict
+        return _ED25519_PRIVATE_KEY_CONVERSION_FUNCTIONS
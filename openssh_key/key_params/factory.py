@@ -2,6 +2,7 @@
 Methods to provide key params classes given OpenSSH key type names.
 """
 
+import sys
 import typing
 
 from .cert import (Cert_DSS_PublicKeyParams,
@@ -103,6 +104,29 @@ _KEY_TYPE_MAPPING = {
         None
     )
 }
+# Key type names are interned when keys are parsed; interning the keys here
+# as well lets lookups compare them by identity rather than by value.
+_KEY_TYPE_MAPPING = {
+    sys.intern(key_type): key_params_classes
+    for key_type, key_params_classes in _KEY_TYPE_MAPPING.items()
+}
+
+_PUBLIC_KEY_PARAMS_CLASSES: typing.Mapping[
+    str,
+    typing.Type[PublicKeyParams]
+] = {
+    key_type: key_params_classes.publicKeyParamsClass
+    for key_type, key_params_classes in _KEY_TYPE_MAPPING.items()
+}
+
+_PRIVATE_KEY_PARAMS_CLASSES: typing.Mapping[
+    str,
+    typing.Type[PrivateKeyParams]
+] = {
+    key_type: key_params_classes.privateKeyParamsClass
+    for key_type, key_params_classes in _KEY_TYPE_MAPPING.items()
+    if key_params_classes.privateKeyParamsClass is not None
+}
 
 
 def create_public_key_params(key_type: str) -> typing.Type[PublicKeyParams]:
@@ -121,7 +145,7 @@ def create_public_key_params(key_type: str) -> typing.Type[PublicKeyParams]:
         KeyError: There is no subclass of :any:`PublicKeyParams` corresponding
             to the given key type name.
     """
-    return _KEY_TYPE_MAPPING[key_type].publicKeyParamsClass
+    return _PUBLIC_KEY_PARAMS_CLASSES[key_type]
 
 
 def create_private_key_params(key_type: str) -> typing.Type[PrivateKeyParams]:
@@ -140,9 +164,12 @@ def create_private_key_params(key_type: str) -> typing.Type[PrivateKeyParams]:
         KeyError: There is no subclass of :any:`PrivateKeyParams` corresponding
             to the given key type name.
     """
-    private_key_params_class = _KEY_TYPE_MAPPING[key_type].privateKeyParamsClass
-    if private_key_params_class is None:
-        raise KeyError(
-            'No subclass of PrivateKeyParams corresponds to the given key type name'
-        )
-    return private_key_params_class
+    try:
+        return _PRIVATE_KEY_PARAMS_CLASSES[key_type]
+    except KeyError:
+        if key_type in _KEY_TYPE_MAPPING:
+            raise KeyError(
+                'No subclass of PrivateKeyParams corresponds to the given key '
+                'type name'
+            ) from None
+        raise
@@ -15,6 +15,36 @@ from openssh_key.pascal_style_byte_stream import (FormatInstructionsDict,
 from .common import ConversionFunctions, PrivateKeyParams, PublicKeyParams
 
 
+def _rsa_public_key_convert_from_cryptography(
+    key_object: cryptography_rsa.RSAPublicKey
+) -> ValuesDict:
+    public_numbers = key_object.public_numbers()
+    return {
+        'e': public_numbers.e,
+        'n': public_numbers.n
+    }
+
+
+def _rsa_public_key_convert_to_cryptography(
+    key_params: ValuesDict
+) -> cryptography_rsa.RSAPublicKey:
+    return cryptography_rsa.RSAPublicNumbers(
+        key_params['e'],
+        key_params['n']
+    ).public_key()
+
+
+_RSA_PUBLIC_KEY_CONVERSION_FUNCTIONS: typing.Mapping[
+    typing.Type[typing.Any],
+    ConversionFunctions
+] = types.MappingProxyType({
+    cryptography_rsa.RSAPublicKey: ConversionFunctions(
+        _rsa_public_key_convert_from_cryptography,
+        _rsa_public_key_convert_to_cryptography
+    )
+})
+
+
 class RSAPublicKeyParams(PublicKeyParams):
     """The parameters comprising a key in the Rivest-Shamir-Adleman (RSA)
     cryptosystem.
@@ -42,16 +72,19 @@ class RSAPublicKeyParams(PublicKeyParams):
         UserWarning: A parameter value from the above list is missing from
             ``params`` or does not have the correct type.
     """
-    __FORMAT_INSTRUCTIONS_DICT: typing.ClassVar[FormatInstructionsDict] = {
+
+    __slots__ = ()
+
+    __FORMAT_INSTRUCTIONS_DICT: typing.ClassVar[
+        FormatInstructionsDict
+    ] = types.MappingProxyType({
         'e': PascalStyleFormatInstruction.MPINT,
         'n': PascalStyleFormatInstruction.MPINT,
-    }
+    })
 
     @classmethod
     def get_format_instructions_dict(cls) -> FormatInstructionsDict:
-        return types.MappingProxyType(
-            RSAPublicKeyParams.__FORMAT_INSTRUCTIONS_DICT
-        )
+        return cls.__FORMAT_INSTRUCTIONS_DICT
 
     @classmethod
     def conversion_functions(
@@ -69,29 +102,52 @@ class RSAPublicKeyParams(PublicKeyParams):
             to functions that take key objects of these types and return
             parameter values.
         """
-        def rsa_public_key_convert_from_cryptography(
-            key_object: cryptography_rsa.RSAPublicKey
-        ) -> ValuesDict:
-            public_numbers = key_object.public_numbers()
-            return {
-                'e': public_numbers.e,
-                'n': public_numbers.n
-            }
+        return _RSA_PUBLIC_KEY_CONVERSION_FUNCTIONS
+
+
+def _rsa_private_key_convert_from_cryptography(
+    key_object: cryptography_rsa.RSAPrivateKey
+) -> ValuesDict:
+    private_numbers = key_object.private_numbers()
+    public_numbers = private_numbers.public_numbers
+    return {
+        'n': public_numbers.n,
+        'e': public_numbers.e,
+        'd': private_numbers.d,
+        'iqmp': private_numbers.iqmp,
+        'p': private_numbers.p,
+        'q': private_numbers.q
+    }
 
-        def rsa_public_key_convert_to_cryptography(
-            key_params: ValuesDict
-        ) -> cryptography_rsa.RSAPublicKey:
-            return cryptography_rsa.RSAPublicNumbers(
-                key_params['e'],
-                key_params['n']
-            ).public_key()
-
-        return {
-            cryptography_rsa.RSAPublicKey: ConversionFunctions(
-                rsa_public_key_convert_from_cryptography,
-                rsa_public_key_convert_to_cryptography
-            )
-        }
+
+def _rsa_private_key_convert_to_cryptography(
+    key_params: ValuesDict
+) -> cryptography_rsa.RSAPrivateKey:
+    return cryptography_rsa.RSAPrivateNumbers(
+        key_params['p'],
+        key_params['q'],
+        key_params['d'],
+        cryptography_rsa.rsa_crt_dmp1(
+            key_params['d'], key_params['p']),
+        cryptography_rsa.rsa_crt_dmq1(
+            key_params['d'], key_params['q']),
+        key_params['iqmp'],
+        cryptography_rsa.RSAPublicNumbers(
+            key_params['e'],
+            key_params['n']
+        )
+    ).private_key()
+
+
+_RSA_PRIVATE_KEY_CONVERSION_FUNCTIONS: typing.Mapping[
+    typing.Type[typing.Any],
+    ConversionFunctions
+] = types.MappingProxyType({
+    cryptography_rsa.RSAPrivateKey: ConversionFunctions(
+        _rsa_private_key_convert_from_cryptography,
+        _rsa_private_key_convert_to_cryptography
+    )
+})
 
 
 RSAPrivateKeyParamsTypeVar = typing.TypeVar(
@@ -124,20 +180,23 @@ class RSAPrivateKeyParams(PrivateKeyParams, RSAPublicKeyParams):
         UserWarning: A parameter value from the above list is missing from
             ``params`` or does not have the correct type.
     """
-    __FORMAT_INSTRUCTIONS_DICT: typing.ClassVar[FormatInstructionsDict] = {
+
+    __slots__ = ()
+
+    __FORMAT_INSTRUCTIONS_DICT: typing.ClassVar[
+        FormatInstructionsDict
+    ] = types.MappingProxyType({
         'n': PascalStyleFormatInstruction.MPINT,
         'e': PascalStyleFormatInstruction.MPINT,
         'd': PascalStyleFormatInstruction.MPINT,
         'iqmp': PascalStyleFormatInstruction.MPINT,
         'p': PascalStyleFormatInstruction.MPINT,
         'q': PascalStyleFormatInstruction.MPINT
-    }
+    })
 
     @classmethod
     def get_format_instructions_dict(cls) -> FormatInstructionsDict:
-        return types.MappingProxyType(
-            RSAPrivateKeyParams.__FORMAT_INSTRUCTIONS_DICT
-        )
+        return cls.__FORMAT_INSTRUCTIONS_DICT
 
     @staticmethod
     def get_public_exponent() -> int:
@@ -191,10 +250,11 @@ class RSAPrivateKeyParams(PrivateKeyParams, RSAPublicKeyParams):
             )
         )
         private_key_numbers = private_key.private_numbers()
-        return cls(
+        public_key_numbers = private_key_numbers.public_numbers
+        return cls._from_trusted_params(
             {
-                'n': private_key_numbers.public_numbers.n,
-                'e': private_key_numbers.public_numbers.e,
+                'n': public_key_numbers.n,
+                'e': public_key_numbers.e,
                 'd': private_key_numbers.d,
                 'iqmp': private_key_numbers.iqmp,
                 'p': private_key_numbers.p,
@@ -218,40 +278,4 @@ class RSAPrivateKeyParams(PrivateKeyParams, RSAPublicKeyParams):
             to functions that take key objects of these types and return
             parameter values.
         """
-        def rsa_private_key_convert_from_cryptography(
-            key_object: cryptography_rsa.RSAPrivateKey
-        ) -> ValuesDict:
-            private_numbers = key_object.private_numbers()
-            return {
-                'n': private_numbers.public_numbers.n,
-                'e': private_numbers.public_numbers.e,
-                'd': private_numbers.d,
-                'iqmp': private_numbers.iqmp,
-                'p': private_numbers.p,
-                'q': private_numbers.q
-            }
-
-        def rsa_private_key_convert_to_cryptography(
-            key_params: ValuesDict
-        ) -> cryptography_rsa.RSAPrivateKey:
-            return cryptography_rsa.RSAPrivateNumbers(
-                key_params['p'],
-                key_params['q'],
-                key_params['d'],
-                cryptography_rsa.rsa_crt_dmp1(
-                    key_params['d'], key_params['p']),
-                cryptography_rsa.rsa_crt_dmp1(
-                    key_params['d'], key_params['q']),
-                key_params['iqmp'],
-                cryptography_rsa.RSAPublicNumbers(
-                    key_params['e'],
-                    key_params['n']
-                )
-            ).private_key()
-
-        return {
-            cryptography_rsa.RSAPrivateKey: ConversionFunctions(
-                rsa_private_key_convert_from_cryptography,
-                rsa_private_key_convert_to_cryptography
-            )
-        }
+        return _RSA_PRIVATE_KEY_CONVERSION_FUNCTIONS
@@ -4,6 +4,7 @@ Classes representing keys stored on security keys.
 
 import abc
 import enum
+import functools
 import types
 import typing
 
@@ -69,20 +70,26 @@ class SecurityKeyPublicKeyParams(
         UserWarning: A parameter value from the above list is missing from
             ``params`` or does not have the correct type.
     """
+
+    __slots__ = ()
+
     @staticmethod
     @abc.abstractmethod
     def get_sk_base_public_key_class() -> typing.Type[PublicKeyParams]:
         return PublicKeyParams
 
-    __FORMAT_INSTRUCTIONS_DICT_SUFFIX: typing.ClassVar[FormatInstructionsDict] = {
+    __FORMAT_INSTRUCTIONS_DICT_SUFFIX: typing.ClassVar[
+        FormatInstructionsDict
+    ] = types.MappingProxyType({
         'application': PascalStyleFormatInstruction.STRING,
-    }
+    })
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_format_instructions_dict(cls) -> FormatInstructionsDict:
         return types.MappingProxyType({
             **cls.get_sk_base_public_key_class().get_format_instructions_dict(),
-            **SecurityKeyPublicKeyParams.__FORMAT_INSTRUCTIONS_DICT_SUFFIX
+            **cls.__FORMAT_INSTRUCTIONS_DICT_SUFFIX
         })
 
     def check_params_are_valid(self) -> None:
@@ -123,18 +130,23 @@ class SecurityKeyPrivateKeyParams(
             ``params`` or does not have the correct type.
     """
 
-    __FORMAT_INSTRUCTIONS_DICT_SUFFIX: typing.ClassVar[FormatInstructionsDict] = {
+    __slots__ = ()
+
+    __FORMAT_INSTRUCTIONS_DICT_SUFFIX: typing.ClassVar[
+        FormatInstructionsDict
+    ] = types.MappingProxyType({
         'application': PascalStyleFormatInstruction.STRING,
         'flags': '>B',
         'key_handle': PascalStyleFormatInstruction.BYTES,
         'reserved': PascalStyleFormatInstruction.BYTES,
-    }
+    })
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_format_instructions_dict(cls) -> FormatInstructionsDict:
         return types.MappingProxyType({
             **cls.get_sk_base_public_key_class().get_format_instructions_dict(),
-            **SecurityKeyPrivateKeyParams.__FORMAT_INSTRUCTIONS_DICT_SUFFIX
+            **cls.__FORMAT_INSTRUCTIONS_DICT_SUFFIX
         })
 
     @classmethod
@@ -170,6 +182,8 @@ class SecurityKey_ECDSA_NISTP256_PublicKeyParams(
     correspond to a private key stored on a security key.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def get_sk_base_public_key_class() -> typing.Type[PublicKeyParams]:
         return ECDSA_NISTP256_PublicKeyParams
@@ -184,6 +198,8 @@ class SecurityKey_ECDSA_NISTP256_PrivateKeyParams(
     ``nistp256`` curve.
     """
 
+    __slots__ = ()
+
 
 class SecurityKey_Ed25519_PublicKeyParams(
     SecurityKeyPublicKeyParams,
@@ -194,6 +210,8 @@ class SecurityKey_Ed25519_PublicKeyParams(
     correspond to a private key stored on a security key.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def get_sk_base_public_key_class() -> typing.Type[PublicKeyParams]:
         return Ed25519PublicKeyParams
@@ -206,3 +224,5 @@ class SecurityKey_Ed25519_PrivateKeyParams(
     """
     The parameters that represent the security key storing an Ed25519 key.
     """
+
+    __slots__ = ()
@@ -7,6 +7,7 @@ import base64
 import collections
 import getpass
 import secrets
+import sys
 import types
 import typing
 import warnings
@@ -215,14 +216,15 @@ class PrivateKeyList(BaseList):
             PascalStyleFormatInstruction.BYTES
         )
 
-        kdf_class = create_kdf(header['kdf'])
+        # Interned to match the interned keys of the KDF and cipher factories
+        kdf_class = create_kdf(sys.intern(header['kdf']))
         kdf_options = PascalStyleByteStream(
             header['kdf_options']
         ).read_from_format_instructions_dict(
             kdf_class.OPTIONS_FORMAT_INSTRUCTIONS_DICT
         )
 
-        cipher_class = create_cipher(header['cipher'])
+        cipher_class = create_cipher(sys.intern(header['cipher']))
 
         if kdf_class == NoneKDF:
             passphrase = ''
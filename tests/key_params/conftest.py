@@ -0,0 +1,9 @@
+import pytest
+from cryptography.hazmat.primitives.asymmetric import dsa
+
+
+@pytest.fixture(scope='session')
+def dsa_parameters():
+    # Generating DSA parameters dominates generating a DSA key, so tests that
+    # need a DSA key share one 1024-bit parameter group
+    return dsa.generate_parameters(1024)
@@ -1,9 +1,15 @@
+import copy
+import pickle
 import secrets
+import types
 
 import pytest
+from cryptography.hazmat.primitives.asymmetric import ed25519
 from openssh_key.key_params import (Ed25519PrivateKeyParams,
                                     Ed25519PublicKeyParams,
-                                    RSAPrivateKeyParams)
+                                    PublicKeyParams, RSAPrivateKeyParams)
+from openssh_key.key_params.common import ConversionFunctions
+from openssh_key.pascal_style_byte_stream import PascalStyleFormatInstruction
 
 
 def test_str():
@@ -22,3 +28,119 @@ def test_convert_to_not_class():
     rsa_private = RSAPrivateKeyParams.generate_private_params()
     with pytest.raises(ValueError):
         assert rsa_private.convert_to('not class')
+
+
+def test_convert_from_subclass_defined_after_use():
+    class KeyObject:
+        pass
+
+    class BasePublicKeyParams(PublicKeyParams):
+        @classmethod
+        def get_format_instructions_dict(cls):
+            return types.MappingProxyType({
+                'public': PascalStyleFormatInstruction.BYTES
+            })
+
+    with pytest.raises(NotImplementedError):
+        BasePublicKeyParams.convert_from(KeyObject())
+
+    public_bytes = secrets.token_bytes(Ed25519PublicKeyParams.KEY_SIZE)
+
+    class KeyObjectPublicKeyParams(BasePublicKeyParams):
+        @classmethod
+        def conversion_functions(cls):
+            return {
+                KeyObject: ConversionFunctions(
+                    lambda key_object: {'public': public_bytes},
+                    lambda key_params: KeyObject()
+                )
+            }
+
+    converted = BasePublicKeyParams.convert_from(KeyObject())
+    assert type(converted) == BasePublicKeyParams
+    assert converted == {'public': public_bytes}
+
+
+def test_generate_private_params_not_checked(mocker):
+    check_params_are_valid = mocker.patch.object(
+        Ed25519PrivateKeyParams,
+        'check_params_are_valid'
+    )
+    ed25519_private = Ed25519PrivateKeyParams.generate_private_params()
+    check_params_are_valid.assert_not_called()
+    assert ed25519_private.convert_to(bytes) == \
+        ed25519_private['private_public'][:Ed25519PrivateKeyParams.KEY_SIZE]
+
+
+def test_abstract_class_not_instantiable():
+    with pytest.raises(TypeError):
+        PublicKeyParams({})
+
+
+def test_convert_to_cached():
+    ed25519_private = Ed25519PrivateKeyParams.generate_private_params()
+    converted = ed25519_private.convert_to(bytes)
+    assert ed25519_private.convert_to(bytes) is converted
+
+
+def test_convert_to_cache_invalidated_by_change():
+    ed25519_private = Ed25519PrivateKeyParams.generate_private_params()
+    ed25519_private.convert_to(bytes)
+    other_ed25519_private = Ed25519PrivateKeyParams.generate_private_params()
+    ed25519_private.update(other_ed25519_private)
+    assert ed25519_private.convert_to(bytes) == \
+        other_ed25519_private.convert_to(bytes)
+
+
+def test_format_instructions_dict_class_attribute():
+    assert 'FORMAT_INSTRUCTIONS_DICT' in vars(Ed25519PrivateKeyParams)
+    assert Ed25519PrivateKeyParams.FORMAT_INSTRUCTIONS_DICT \
+        == Ed25519PrivateKeyParams.get_format_instructions_dict()
+
+
+def test_init_from_changed_params_object_checked():
+    ed25519_private = Ed25519PrivateKeyParams.generate_private_params()
+    del ed25519_private['public']
+    with pytest.warns(UserWarning, match='public missing'):
+        Ed25519PublicKeyParams(ed25519_private)
+
+
+def test_copy_preserves_class():
+    ed25519_private = Ed25519PrivateKeyParams.generate_private_params()
+    ed25519_private_copy = ed25519_private.copy()
+    assert type(ed25519_private_copy) == Ed25519PrivateKeyParams
+    assert ed25519_private_copy == ed25519_private
+    assert ed25519_private_copy is not ed25519_private
+    assert ed25519_private_copy.convert_to(bytes) == \
+        ed25519_private.convert_to(bytes)
+
+
+def test_or_preserves_class():
+    ed25519_private = Ed25519PrivateKeyParams.generate_private_params()
+    comment = {'comment': 'comment'}
+    assert type(ed25519_private | comment) == Ed25519PrivateKeyParams
+    assert ed25519_private | comment == {**ed25519_private, **comment}
+    assert type(comment | ed25519_private) == Ed25519PrivateKeyParams
+    assert comment | ed25519_private == {**comment, **ed25519_private}
+
+
+def test_pickle_after_convert_to():
+    ed25519_private = Ed25519PrivateKeyParams.generate_private_params()
+    ed25519_private.convert_to(ed25519.Ed25519PrivateKey)
+    unpickled = pickle.loads(pickle.dumps(ed25519_private))
+    assert type(unpickled) == Ed25519PrivateKeyParams
+    assert unpickled == ed25519_private
+    assert isinstance(
+        unpickled.convert_to(ed25519.Ed25519PrivateKey),
+        ed25519.Ed25519PrivateKey
+    )
+
+
+@pytest.mark.parametrize('copy_function', [copy.copy, copy.deepcopy])
+def test_copy_after_convert_to_not_cached(copy_function):
+    ed25519_private = Ed25519PrivateKeyParams.generate_private_params()
+    converted = ed25519_private.convert_to(ed25519.Ed25519PrivateKey)
+    copied = copy_function(ed25519_private)
+    assert type(copied) == Ed25519PrivateKeyParams
+    assert copied == ed25519_private
+    assert copied.convert_to(ed25519.Ed25519PrivateKey) is not converted
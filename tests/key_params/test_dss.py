@@ -1,6 +1,9 @@
 import pytest
+from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import dsa
 from openssh_key.key_params import DSSPrivateKeyParams, DSSPublicKeyParams
+from openssh_key.key_params.dss import (
+    _dsa_private_key_convert_to_cryptography, _dsa_private_key_der)
 from openssh_key.pascal_style_byte_stream import PascalStyleFormatInstruction
 
 PARAMS_TEST_CASES = [
@@ -39,15 +42,33 @@ PARAMS_TEST_CASES = [
 ]
 
 
+def test_dss_private_format_instructions_dict_extends_public():
+    public_format_instructions_dict = \
+        DSSPublicKeyParams.get_format_instructions_dict()
+    private_format_instructions_dict = \
+        DSSPrivateKeyParams.get_format_instructions_dict()
+    assert list(private_format_instructions_dict.items())[
+        :len(public_format_instructions_dict)
+    ] == list(public_format_instructions_dict.items())
+    assert DSSPrivateKeyParams.get_format_instructions_dict() \
+        is private_format_instructions_dict
+
+
+@pytest.mark.parametrize(
+    'dss_class', [DSSPublicKeyParams, DSSPrivateKeyParams]
+)
+def test_dss_conversion_functions_cached(dss_class):
+    assert dss_class.conversion_functions() \
+        is dss_class.conversion_functions()
+
+
 def test_dss_public_convert_from_unknown():
     with pytest.raises(NotImplementedError):
         DSSPublicKeyParams.convert_from('random')
 
 
-def test_dss_public_convert_from_cryptography_public():
-    private_key = dsa.generate_private_key(
-        DSSPrivateKeyParams.KEY_SIZE
-    ).public_key()
+def test_dss_public_convert_from_cryptography_public(dsa_parameters):
+    private_key = dsa_parameters.generate_private_key().public_key()
     public_numbers = private_key.public_numbers()
     parameter_numbers = public_numbers.parameter_numbers
     converted = DSSPublicKeyParams.convert_from(private_key)
@@ -60,10 +81,8 @@ def test_dss_public_convert_from_cryptography_public():
     }
 
 
-def test_dss_public_convert_from_cryptography_private():
-    private_key = dsa.generate_private_key(
-        DSSPrivateKeyParams.KEY_SIZE
-    )
+def test_dss_public_convert_from_cryptography_private(dsa_parameters):
+    private_key = dsa_parameters.generate_private_key()
     private_numbers = private_key.private_numbers()
     public_numbers = private_numbers.public_numbers
     parameter_numbers = public_numbers.parameter_numbers
@@ -77,8 +96,10 @@ def test_dss_public_convert_from_cryptography_private():
     }
 
 
-def test_dss_public_convert_to_cryptography_public():
-    dss_private = DSSPrivateKeyParams.generate_private_params()
+def test_dss_public_convert_to_cryptography_public(dsa_parameters):
+    dss_private = DSSPrivateKeyParams.generate_private_params(
+        parameters=dsa_parameters
+    )
     dss_public = DSSPublicKeyParams({
         'p': dss_private['p'],
         'q': dss_private['q'],
@@ -102,10 +123,8 @@ def test_dss_private_convert_from_unknown():
         DSSPrivateKeyParams.convert_from('random')
 
 
-def test_dss_private_convert_from_cryptography_private():
-    private_key = dsa.generate_private_key(
-        DSSPrivateKeyParams.KEY_SIZE
-    )
+def test_dss_private_convert_from_cryptography_private(dsa_parameters):
+    private_key = dsa_parameters.generate_private_key()
     private_numbers = private_key.private_numbers()
     public_numbers = private_numbers.public_numbers
     parameter_numbers = public_numbers.parameter_numbers
@@ -120,8 +139,10 @@ def test_dss_private_convert_from_cryptography_private():
     }
 
 
-def test_dss_private_convert_to_cryptography_private():
-    dss_private = DSSPrivateKeyParams.generate_private_params()
+def test_dss_private_convert_to_cryptography_private(dsa_parameters):
+    dss_private = DSSPrivateKeyParams.generate_private_params(
+        parameters=dsa_parameters
+    )
     converted = dss_private.convert_to(dsa.DSAPrivateKey)
     assert isinstance(converted, dsa.DSAPrivateKey)
     assert converted.private_numbers() == dsa.DSAPrivateNumbers(
@@ -137,8 +158,10 @@ def test_dss_private_convert_to_cryptography_private():
     )
 
 
-def test_dss_private_convert_to_cryptography_dssprivatekey():
-    dss_private = DSSPrivateKeyParams.generate_private_params()
+def test_dss_private_convert_to_cryptography_dssprivatekey(dsa_parameters):
+    dss_private = DSSPrivateKeyParams.generate_private_params(
+        parameters=dsa_parameters
+    )
     converted = dss_private.convert_to(dsa.DSAPrivateKey)
     assert isinstance(converted, dsa.DSAPrivateKey)
     assert converted.private_numbers() == dsa.DSAPrivateNumbers(
@@ -154,8 +177,66 @@ def test_dss_private_convert_to_cryptography_dssprivatekey():
     )
 
 
-def test_dss_private_convert_to_cryptography_public():
-    dss_private = DSSPrivateKeyParams.generate_private_params()
+def test_dss_private_convert_to_cryptography_skip_consistency_check(
+    mocker,
+    dsa_parameters
+):
+    dss_private = DSSPrivateKeyParams.generate_private_params(
+        parameters=dsa_parameters
+    )
+    inconsistent_values = {**dss_private, 'y': dss_private['y'] + 1}
+    with pytest.raises(ValueError):
+        DSSPrivateKeyParams(inconsistent_values).convert_to(dsa.DSAPrivateKey)
+    mocker.patch.object(DSSPrivateKeyParams, 'SKIP_CONSISTENCY_CHECK', True)
+    converted = DSSPrivateKeyParams(
+        inconsistent_values
+    ).convert_to(dsa.DSAPrivateKey)
+    assert isinstance(converted, dsa.DSAPrivateKey)
+    assert converted.private_numbers() == dsa.DSAPrivateNumbers(
+        inconsistent_values['x'],
+        dsa.DSAPublicNumbers(
+            inconsistent_values['y'],
+            dsa.DSAParameterNumbers(
+                inconsistent_values['p'],
+                inconsistent_values['q'],
+                inconsistent_values['g']
+            )
+        )
+    )
+
+
+def test_dss_private_convert_to_cryptography_skip_consistency_check_override(
+    mocker,
+    dsa_parameters
+):
+    class SkipConsistencyCheckParams(dict):
+        SKIP_CONSISTENCY_CHECK = True
+
+    load_der_private_key = mocker.spy(serialization, 'load_der_private_key')
+    dss_private = DSSPrivateKeyParams.generate_private_params(
+        parameters=dsa_parameters
+    )
+    converted = _dsa_private_key_convert_to_cryptography(
+        SkipConsistencyCheckParams(dss_private)
+    )
+    load_der_private_key.assert_called_once()
+    assert converted.private_numbers().x == dss_private['x']
+
+
+def test_dss_private_key_der_matches_cryptography(dsa_parameters):
+    private_key = dsa_parameters.generate_private_key()
+    dss_private = DSSPrivateKeyParams.convert_from(private_key)
+    assert _dsa_private_key_der(dss_private) == private_key.private_bytes(
+        serialization.Encoding.DER,
+        serialization.PrivateFormat.TraditionalOpenSSL,
+        serialization.NoEncryption()
+    )
+
+
+def test_dss_private_convert_to_cryptography_public(dsa_parameters):
+    dss_private = DSSPrivateKeyParams.generate_private_params(
+        parameters=dsa_parameters
+    )
     converted = dss_private.convert_to(dsa.DSAPublicKey)
     assert isinstance(converted, dsa.DSAPublicKey)
     assert converted.public_numbers() == dsa.DSAPublicNumbers(
@@ -168,7 +249,71 @@ def test_dss_private_convert_to_cryptography_public():
     )
 
 
-def test_dss_public_convert_to_not_implemented():
+def test_dss_private_to_public(dsa_parameters):
+    dss_private = DSSPrivateKeyParams.generate_private_params(
+        parameters=dsa_parameters
+    )
+    dss_public = dss_private.to_public()
+    assert type(dss_public) == DSSPublicKeyParams
+    assert dss_public == {
+        'p': dss_private['p'],
+        'q': dss_private['q'],
+        'g': dss_private['g'],
+        'y': dss_private['y'],
+    }
+    assert dss_public.convert_to(dsa.DSAPublicKey).public_numbers() == \
+        dss_private.convert_to(dsa.DSAPrivateKey).public_key().public_numbers()
+
+
+def test_dss_private_to_public_missing_value(dsa_parameters):
+    dss_private = DSSPrivateKeyParams.generate_private_params(
+        parameters=dsa_parameters
+    )
+    del dss_private['y']
+    with pytest.warns(UserWarning, match='y missing'):
+        dss_public = dss_private.to_public()
+    assert dss_public == {
+        'p': dss_private['p'],
+        'q': dss_private['q'],
+        'g': dss_private['g'],
+    }
+
+
+def test_dss_private_generate_private_params():
     dss_private = DSSPrivateKeyParams.generate_private_params()
+    assert dss_private['p'].bit_length() == DSSPrivateKeyParams.KEY_SIZE
+    assert pow(dss_private['g'], dss_private['x'], dss_private['p']) \
+        == dss_private['y']
+
+
+def test_dss_private_generate_private_params_from_parameters(dsa_parameters):
+    parameter_numbers = dsa_parameters.parameter_numbers()
+    first = DSSPrivateKeyParams.generate_private_params(
+        parameters=dsa_parameters
+    )
+    second = DSSPrivateKeyParams.generate_private_params(
+        parameters=dsa_parameters
+    )
+    for dss_private in (first, second):
+        assert (dss_private['p'], dss_private['q'], dss_private['g']) == (
+            parameter_numbers.p,
+            parameter_numbers.q,
+            parameter_numbers.g
+        )
+    assert first['x'] != second['x']
+
+
+def test_dss_params_have_no_instance_dict(dsa_parameters):
+    dss_private = DSSPrivateKeyParams.generate_private_params(
+        parameters=dsa_parameters
+    )
+    assert not hasattr(dss_private, '__dict__')
+    assert not hasattr(dss_private.to_public(), '__dict__')
+
+
+def test_dss_public_convert_to_not_implemented(dsa_parameters):
+    dss_private = DSSPrivateKeyParams.generate_private_params(
+        parameters=dsa_parameters
+    )
     with pytest.raises(NotImplementedError):
         assert dss_private.convert_to(type)
@@ -188,6 +188,13 @@ _ECDSA_CURVES = [
 ]
 
 
+@pytest.mark.parametrize('ecdsa_curve', _ECDSA_CURVES)
+def test_ecdsa_conversion_functions_cached(ecdsa_curve):
+    for ecdsa_class in (ecdsa_curve['public_cls'], ecdsa_curve['private_cls']):
+        assert ecdsa_class.conversion_functions() \
+            is ecdsa_class.conversion_functions()
+
+
 def test_ecdsa_public_convert_from_unknown():
     with pytest.raises(NotImplementedError):
         ECDSAPublicKeyParams.convert_from('random')
@@ -367,3 +374,10 @@ def test_ecdsa_public_convert_to_not_implemented(ecdsa_curve):
     ecdsa_private = ecdsa_curve['private_cls'].generate_private_params()
     with pytest.raises(NotImplementedError):
         assert ecdsa_private.convert_to(type)
+
+
+@pytest.mark.parametrize('ecdsa_curve', _ECDSA_CURVES)
+def test_ecdsa_get_curve(ecdsa_curve):
+    curve = ecdsa_curve['public_cls'].get_curve()
+    assert type(curve) == ecdsa_curve['cryptography_curve_type']
+    assert ecdsa_curve['public_cls'].get_curve() is curve
@@ -1,12 +1,13 @@
 import secrets
-import sys
+import types
 
 import nacl.signing
 import pytest
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import ed25519
 from openssh_key.key_params import (Ed25519PrivateKeyParams,
-                                    Ed25519PublicKeyParams)
+                                    Ed25519PublicKeyParams, PublicKeyParams)
+from openssh_key.key_params import ed25519 as ed25519_key_params
 from openssh_key.pascal_style_byte_stream import PascalStyleFormatInstruction
 
 test_cases_public_bytes = secrets.token_bytes(Ed25519PublicKeyParams.KEY_SIZE)
@@ -65,6 +66,35 @@ PARAMS_TEST_CASES = [
 ]
 
 
+@pytest.fixture
+def missing_pynacl(mocker):
+    mocker.patch.object(ed25519_key_params, '_NACL_AVAILABLE', False)
+    for name in (
+        '_ED25519_PUBLIC_KEY_CONVERSION_FUNCTIONS',
+        '_ED25519_PRIVATE_KEY_CONVERSION_FUNCTIONS'
+    ):
+        mocker.patch.object(
+            ed25519_key_params,
+            name,
+            types.MappingProxyType({
+                k: v
+                for k, v in getattr(ed25519_key_params, name).items()
+                if k not in (nacl.signing.VerifyKey, nacl.signing.SigningKey)
+            })
+        )
+    PublicKeyParams._find_conversion_functions_to.cache_clear()
+    yield
+    PublicKeyParams._find_conversion_functions_to.cache_clear()
+
+
+@pytest.mark.parametrize(
+    'ed25519_class', [Ed25519PublicKeyParams, Ed25519PrivateKeyParams]
+)
+def test_ed25519_conversion_functions_cached(ed25519_class):
+    assert ed25519_class.conversion_functions() \
+        is ed25519_class.conversion_functions()
+
+
 def test_ed25519_public_convert_from_unknown():
     with pytest.raises(NotImplementedError):
         Ed25519PublicKeyParams.convert_from('random')
@@ -156,8 +186,7 @@ def test_ed25519_public_convert_to_pynacl_public():
     assert bytes(converted) == ed25519_public['public']
 
 
-def test_ed25519_public_convert_to_missing_pynacl(mocker):
-    mocker.patch.dict(sys.modules, {'nacl': None})
+def test_ed25519_public_convert_to_missing_pynacl(missing_pynacl):
     ed25519_private = Ed25519PrivateKeyParams.generate_private_params()
     ed25519_public = Ed25519PublicKeyParams({
         'public': ed25519_private['public']
@@ -272,8 +301,7 @@ def test_ed25519_private_convert_to_pynacl_public():
     assert bytes(converted) == ed25519_private['public']
 
 
-def test_ed25519_private_convert_to_missing_pynacl(mocker):
-    mocker.patch.dict(sys.modules, {'nacl': None})
+def test_ed25519_private_convert_to_missing_pynacl(missing_pynacl):
     ed25519_private = Ed25519PrivateKeyParams.generate_private_params()
     with pytest.raises(NotImplementedError):
         ed25519_private.convert_to(nacl.signing.VerifyKey)
@@ -1,3 +1,5 @@
+import re
+
 import pytest
 
 from openssh_key.key_params import (DSSPrivateKeyParams, DSSPublicKeyParams,
@@ -26,180 +28,128 @@ from openssh_key.key_params import (DSSPrivateKeyParams, DSSPublicKeyParams,
                                     create_public_key_params)
 
 
-def test_factory_rsa_public():
-    assert create_public_key_params('ssh-rsa') == RSAPublicKeyParams
-
-
-def test_factory_rsa_private():
-    assert create_private_key_params('ssh-rsa') == RSAPrivateKeyParams
-
-
-def test_factory_ed25519_public():
-    assert create_public_key_params('ssh-ed25519') == Ed25519PublicKeyParams
-
-
-def test_factory_ed25519_private():
-    assert create_private_key_params('ssh-ed25519') == Ed25519PrivateKeyParams
-
-
-def test_factory_dss_public():
-    assert create_public_key_params('ssh-dss') == DSSPublicKeyParams
-
-
-def test_factory_dss_private():
-    assert create_private_key_params('ssh-dss') == DSSPrivateKeyParams
-
-
-def test_factory_ecdsa_nistp256_public():
-    assert create_public_key_params(
-        'ssh-ecdsa-nistp256') == ECDSA_NISTP256_PublicKeyParams
-
-
-def test_factory_ecdsa_nistp256_private():
-    assert create_private_key_params(
-        'ssh-ecdsa-nistp256') == ECDSA_NISTP256_PrivateKeyParams
-
-
-def test_factory_ecdsa_nistp384_public():
-    assert create_public_key_params(
-        'ssh-ecdsa-nistp384') == ECDSA_NISTP384_PublicKeyParams
-
-
-def test_factory_ecdsa_nistp384_private():
-    assert create_private_key_params(
-        'ssh-ecdsa-nistp384') == ECDSA_NISTP384_PrivateKeyParams
-
-
-def test_factory_ecdsa_nistp521_public():
-    assert create_public_key_params(
-        'ssh-ecdsa-nistp521') == ECDSA_NISTP521_PublicKeyParams
-
-
-def test_factory_ecdsa_nistp521_private():
-    assert create_private_key_params(
-        'ssh-ecdsa-nistp521') == ECDSA_NISTP521_PrivateKeyParams
-
-
-def test_factory_sk_ecdsa_nistp256_public():
-    assert create_public_key_params(
-        'sk-ecdsa-sha2-nistp256@openssh.com') == SecurityKey_ECDSA_NISTP256_PublicKeyParams
-
-
-def test_factory_sk_ecdsa_nistp256_private():
-    assert create_private_key_params(
-        'sk-ecdsa-sha2-nistp256@openssh.com') == SecurityKey_ECDSA_NISTP256_PrivateKeyParams
-
-
-def test_factory_sk_ed25519_public():
-    assert create_public_key_params(
-        'sk-ssh-ed25519@openssh.com') == SecurityKey_Ed25519_PublicKeyParams
-
-
-def test_factory_sk_ed25519_private():
-    assert create_private_key_params(
-        'sk-ssh-ed25519@openssh.com') == SecurityKey_Ed25519_PrivateKeyParams
-
-
-def test_factory_cert_rsa_public():
-    assert create_public_key_params(
-        'ssh-rsa-cert-v01@openssh.com') == Cert_RSA_PublicKeyParams
-
-
-def test_factory_cert_rsa_private():
-    with pytest.raises(
-        KeyError,
-        match='No subclass of PrivateKeyParams corresponds to the given key type name'
-    ):
-        create_private_key_params('ssh-rsa-cert-v01@openssh.com')
-
-
-def test_factory_cert_ed25519_public():
-    assert create_public_key_params(
-        'ssh-ed25519-cert-v01@openssh.com') == Cert_Ed25519_PublicKeyParams
-
-
-def test_factory_cert_ed25519_private():
-    with pytest.raises(
-        KeyError,
-        match='No subclass of PrivateKeyParams corresponds to the given key type name'
-    ):
-        create_private_key_params('ssh-ed25519-cert-v01@openssh.com')
-
-
-def test_factory_cert_dss_public():
-    assert create_public_key_params(
-        'ssh-dss-cert-v01@openssh.com') == Cert_DSS_PublicKeyParams
-
-
-def test_factory_cert_dss_private():
-    with pytest.raises(
-        KeyError,
-        match='No subclass of PrivateKeyParams corresponds to the given key type name'
-    ):
-        create_private_key_params('ssh-dss-cert-v01@openssh.com')
-
-
-def test_factory_cert_ecdsa_nistp256_public():
-    assert create_public_key_params(
-        'ecdsa-sha2-nistp256-cert-v01@openssh.com') == Cert_ECDSA_NISTP256_PublicKeyParams
-
-
-def test_factory_cert_ecdsa_nistp256_private():
-    with pytest.raises(
-        KeyError,
-        match='No subclass of PrivateKeyParams corresponds to the given key type name'
-    ):
-        create_private_key_params('ecdsa-sha2-nistp256-cert-v01@openssh.com')
-
-
-def test_factory_cert_ecdsa_nistp384_public():
-    assert create_public_key_params(
-        'ecdsa-sha2-nistp384-cert-v01@openssh.com') == Cert_ECDSA_NISTP384_PublicKeyParams
-
-
-def test_factory_cert_ecdsa_nistp384_private():
-    with pytest.raises(
-        KeyError,
-        match='No subclass of PrivateKeyParams corresponds to the given key type name'
-    ):
-        create_private_key_params('ecdsa-sha2-nistp384-cert-v01@openssh.com')
-
-
-def test_factory_cert_ecdsa_nistp521_public():
-    assert create_public_key_params(
-        'ecdsa-sha2-nistp521-cert-v01@openssh.com') == Cert_ECDSA_NISTP521_PublicKeyParams
-
-
-def test_factory_cert_ecdsa_nistp521_private():
-    with pytest.raises(
-        KeyError,
-        match='No subclass of PrivateKeyParams corresponds to the given key type name'
-    ):
-        create_private_key_params('ecdsa-sha2-nistp521-cert-v01@openssh.com')
-
-
-def test_factory_cert_sk_ed25519_public():
-    assert create_public_key_params(
-        'sk-ssh-ed25519-cert-v01@openssh.com') == Cert_SecurityKey_Ed25519_PublicKeyParams
-
-
-def test_factory_cert_sk_ed25519_private():
-    with pytest.raises(
-        KeyError,
-        match='No subclass of PrivateKeyParams corresponds to the given key type name'
-    ):
-        create_private_key_params('sk-ssh-ed25519-cert-v01@openssh.com')
-
-
-def test_factory_cert_sk_ecdsa_nistp256_public():
-    assert create_public_key_params(
-        'sk-ecdsa-sha2-nistp256-cert-v01@openssh.com') == Cert_SecurityKey_ECDSA_NISTP256_PublicKeyParams
-
-
-def test_factory_cert_sk_ecdsa_nistp256_private():
-    with pytest.raises(
-        KeyError,
-        match='No subclass of PrivateKeyParams corresponds to the given key type name'
-    ):
-        create_private_key_params(
-            'sk-ecdsa-sha2-nistp256-cert-v01@openssh.com')
+_NO_SUBCLASS_RE = re.compile(
+    'No subclass of PrivateKeyParams corresponds to the given key type name'
+)
+
+_PUBLIC_KEY_PARAMS_TEST_CASES = [
+    ('rsa', 'ssh-rsa', RSAPublicKeyParams),
+    ('ed25519', 'ssh-ed25519', Ed25519PublicKeyParams),
+    ('dss', 'ssh-dss', DSSPublicKeyParams),
+    ('ecdsa_nistp256', 'ssh-ecdsa-nistp256', ECDSA_NISTP256_PublicKeyParams),
+    ('ecdsa_nistp384', 'ssh-ecdsa-nistp384', ECDSA_NISTP384_PublicKeyParams),
+    ('ecdsa_nistp521', 'ssh-ecdsa-nistp521', ECDSA_NISTP521_PublicKeyParams),
+    (
+        'sk_ecdsa_nistp256',
+        'sk-ecdsa-sha2-nistp256@openssh.com',
+        SecurityKey_ECDSA_NISTP256_PublicKeyParams
+    ),
+    (
+        'sk_ed25519',
+        'sk-ssh-ed25519@openssh.com',
+        SecurityKey_Ed25519_PublicKeyParams
+    ),
+    ('cert_rsa', 'ssh-rsa-cert-v01@openssh.com', Cert_RSA_PublicKeyParams),
+    (
+        'cert_ed25519',
+        'ssh-ed25519-cert-v01@openssh.com',
+        Cert_Ed25519_PublicKeyParams
+    ),
+    ('cert_dss', 'ssh-dss-cert-v01@openssh.com', Cert_DSS_PublicKeyParams),
+    (
+        'cert_ecdsa_nistp256',
+        'ecdsa-sha2-nistp256-cert-v01@openssh.com',
+        Cert_ECDSA_NISTP256_PublicKeyParams
+    ),
+    (
+        'cert_ecdsa_nistp384',
+        'ecdsa-sha2-nistp384-cert-v01@openssh.com',
+        Cert_ECDSA_NISTP384_PublicKeyParams
+    ),
+    (
+        'cert_ecdsa_nistp521',
+        'ecdsa-sha2-nistp521-cert-v01@openssh.com',
+        Cert_ECDSA_NISTP521_PublicKeyParams
+    ),
+    (
+        'cert_sk_ed25519',
+        'sk-ssh-ed25519-cert-v01@openssh.com',
+        Cert_SecurityKey_Ed25519_PublicKeyParams
+    ),
+    (
+        'cert_sk_ecdsa_nistp256',
+        'sk-ecdsa-sha2-nistp256-cert-v01@openssh.com',
+        Cert_SecurityKey_ECDSA_NISTP256_PublicKeyParams
+    ),
+]
+
+_PRIVATE_KEY_PARAMS_TEST_CASES = [
+    ('rsa', 'ssh-rsa', RSAPrivateKeyParams),
+    ('ed25519', 'ssh-ed25519', Ed25519PrivateKeyParams),
+    ('dss', 'ssh-dss', DSSPrivateKeyParams),
+    ('ecdsa_nistp256', 'ssh-ecdsa-nistp256', ECDSA_NISTP256_PrivateKeyParams),
+    ('ecdsa_nistp384', 'ssh-ecdsa-nistp384', ECDSA_NISTP384_PrivateKeyParams),
+    ('ecdsa_nistp521', 'ssh-ecdsa-nistp521', ECDSA_NISTP521_PrivateKeyParams),
+    (
+        'sk_ecdsa_nistp256',
+        'sk-ecdsa-sha2-nistp256@openssh.com',
+        SecurityKey_ECDSA_NISTP256_PrivateKeyParams
+    ),
+    (
+        'sk_ed25519',
+        'sk-ssh-ed25519@openssh.com',
+        SecurityKey_Ed25519_PrivateKeyParams
+    ),
+]
+
+_NO_PRIVATE_KEY_PARAMS_TEST_CASES = [
+    ('cert_rsa', 'ssh-rsa-cert-v01@openssh.com'),
+    ('cert_ed25519', 'ssh-ed25519-cert-v01@openssh.com'),
+    ('cert_dss', 'ssh-dss-cert-v01@openssh.com'),
+    ('cert_ecdsa_nistp256', 'ecdsa-sha2-nistp256-cert-v01@openssh.com'),
+    ('cert_ecdsa_nistp384', 'ecdsa-sha2-nistp384-cert-v01@openssh.com'),
+    ('cert_ecdsa_nistp521', 'ecdsa-sha2-nistp521-cert-v01@openssh.com'),
+    ('cert_sk_ed25519', 'sk-ssh-ed25519-cert-v01@openssh.com'),
+    (
+        'cert_sk_ecdsa_nistp256',
+        'sk-ecdsa-sha2-nistp256-cert-v01@openssh.com'
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    'key_type,key_params_class',
+    [test_case[1:] for test_case in _PUBLIC_KEY_PARAMS_TEST_CASES],
+    ids=[test_case[0] for test_case in _PUBLIC_KEY_PARAMS_TEST_CASES]
+)
+def test_factory_public(key_type, key_params_class):
+    assert create_public_key_params(key_type) == key_params_class
+
+
+@pytest.mark.parametrize(
+    'key_type,key_params_class',
+    [test_case[1:] for test_case in _PRIVATE_KEY_PARAMS_TEST_CASES],
+    ids=[test_case[0] for test_case in _PRIVATE_KEY_PARAMS_TEST_CASES]
+)
+def test_factory_private(key_type, key_params_class):
+    assert create_private_key_params(key_type) == key_params_class
+
+
+@pytest.mark.parametrize(
+    'key_type',
+    [test_case[1] for test_case in _NO_PRIVATE_KEY_PARAMS_TEST_CASES],
+    ids=[test_case[0] for test_case in _NO_PRIVATE_KEY_PARAMS_TEST_CASES]
+)
+def test_factory_private_not_found(key_type):
+    with pytest.raises(KeyError, match=_NO_SUBCLASS_RE):
+        create_private_key_params(key_type)
+
+
+def test_factory_public_unknown_key_type():
+    with pytest.raises(KeyError):
+        create_public_key_params('unknown')
+
+
+def test_factory_private_unknown_key_type():
+    with pytest.raises(KeyError, match='unknown'):
+        create_private_key_params('unknown')
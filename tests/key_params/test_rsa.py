@@ -37,6 +37,14 @@ PARAMS_TEST_CASES = [
 ]
 
 
+@pytest.mark.parametrize(
+    'rsa_class', [RSAPublicKeyParams, RSAPrivateKeyParams]
+)
+def test_rsa_conversion_functions_cached(rsa_class):
+    assert rsa_class.conversion_functions() \
+        is rsa_class.conversion_functions()
+
+
 def test_rsa_public_convert_from_unknown():
     with pytest.raises(NotImplementedError):
         RSAPublicKeyParams.convert_from('random')
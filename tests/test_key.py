@@ -1,4 +1,5 @@
 import base64
+import sys
 
 import pytest
 from openssh_key.key import PrivateKey, PublicKey
@@ -256,6 +257,22 @@ PUBLIC_KEY_TEST = PublicKey(
 )
 
 
+def test_public_key_peek_header():
+    public_key_bytes, _ = correct_public_key_bytes_ed25519()
+    assert PublicKey.peek_header(public_key_bytes) == ED25519_TEST_HEADER
+
+
+def test_private_key_peek_header():
+    private_key_bytes, _ = correct_private_key_bytes_ed25519()
+    assert PrivateKey.peek_header(private_key_bytes) == ED25519_TEST_HEADER
+
+
+def test_public_key_from_bytes_interns_key_type():
+    public_key_bytes, _ = correct_public_key_bytes_ed25519()
+    public_key = PublicKey.from_bytes(public_key_bytes)
+    assert public_key.header['key_type'] is sys.intern('ssh-ed25519')
+
+
 def test_public_key_from_string():
     comment = 'comment with multiple words'
     public_key_bytes = PUBLIC_KEY_TEST.pack_public_bytes()
@@ -264,13 +281,15 @@ def test_public_key_from_string():
         public_key_b64 + ' ' + \
         comment
     public_key = PublicKey.from_string(public_key_string)
-    assert public_key.__dict__ == {
-        **PUBLIC_KEY_TEST.__dict__,
-        'clear': {
+    assert public_key == PublicKey(
+        PUBLIC_KEY_TEST.header,
+        PUBLIC_KEY_TEST.params,
+        PUBLIC_KEY_TEST.footer,
+        {
             'key_type': PUBLIC_KEY_TEST.header['key_type'],
             'comment': comment
         }
-    }
+    )
 
 
 def test_public_key_from_string_inconsistent_key_type():
@@ -285,13 +304,15 @@ def test_public_key_from_string_inconsistent_key_type():
         match='Inconsistency between clear and encoded key types'
     ):
         public_key = PublicKey.from_string(public_key_string)
-    assert public_key.__dict__ == {
-        **PUBLIC_KEY_TEST.__dict__,
-        'clear': {
+    assert public_key == PublicKey(
+        PUBLIC_KEY_TEST.header,
+        PUBLIC_KEY_TEST.params,
+        PUBLIC_KEY_TEST.footer,
+        {
             'key_type': 'ssh-rsa',
             'comment': comment
         }
-    }
+    )
 
 
 def test_public_key_from_string_not_a_key():
@@ -314,6 +335,26 @@ def test_public_key_pack_public_bytes():
     ) == {}
 
 
+def test_public_key_pack_public_bytes_repeated():
+    _, public_key = correct_public_key_bytes_ed25519()
+    assert public_key.pack_public_bytes() == public_key.pack_public_bytes()
+
+
+def test_public_key_pack_public_bytes_after_params_changed():
+    _, public_key = correct_public_key_bytes_ed25519()
+    public_key.pack_public_bytes()
+    public_key.params['public'] = bytes(Ed25519PublicKeyParams.KEY_SIZE)
+    public_key_byte_stream = PascalStyleByteStream(
+        public_key.pack_public_bytes()
+    )
+    public_key_byte_stream.read_from_format_instructions_dict(
+        PublicKey.HEADER_FORMAT_INSTRUCTIONS_DICT
+    )
+    assert public_key_byte_stream.read_from_format_instructions_dict(
+        Ed25519PublicKeyParams.FORMAT_INSTRUCTIONS_DICT
+    ) == {'public': bytes(Ed25519PublicKeyParams.KEY_SIZE)}
+
+
 def test_public_key_pack_public_string():
     _, public_key = correct_public_key_bytes_ed25519()
     public_key_string = public_key.pack_public_string()
@@ -422,6 +463,24 @@ def test_private_key_pack_private_bytes():
     ) == PRIVATE_TEST_FOOTER
 
 
+def test_private_key_pack_private_bytes_after_footer_changed():
+    _, private_key = correct_private_key_bytes_ed25519()
+    private_key.pack_private_bytes()
+    private_key.footer['comment'] = 'changed'
+    private_key_byte_stream = PascalStyleByteStream(
+        private_key.pack_private_bytes()
+    )
+    private_key_byte_stream.read_from_format_instructions_dict(
+        PrivateKey.HEADER_FORMAT_INSTRUCTIONS_DICT
+    )
+    private_key_byte_stream.read_from_format_instructions_dict(
+        Ed25519PrivateKeyParams.FORMAT_INSTRUCTIONS_DICT
+    )
+    assert private_key_byte_stream.read_from_format_instructions_dict(
+        PrivateKey.FOOTER_FORMAT_INSTRUCTIONS_DICT
+    ) == {'comment': 'changed'}
+
+
 def test_private_key_pack_public_string():
     _, private_key = correct_private_key_bytes_ed25519()
     public_key_string = private_key.pack_public_string()
@@ -453,3 +512,14 @@ def test_private_key_pack_public_string_no_footer_comment():
         private_key.header['key_type'] + ' ' +
         base64.b64encode(private_key.pack_public_bytes()).decode() + '\n'
     )
+
+
+def test_key_eq_same_key():
+    _, public_key = correct_public_key_bytes_ed25519()
+    assert public_key == public_key
+
+
+def test_key_unhashable():
+    _, public_key = correct_public_key_bytes_ed25519()
+    with pytest.raises(TypeError):
+        hash(public_key)